@@ -98,23 +98,24 @@ class Player:
             print(f"Nombre d'étapes : {len(self.path)}")
 
 
-# Initialisation du labyrinthe (0 = chemin, 1 = mur, 'S' = départ, 'G' = arrivée)
-labyrinthe_grid = [
-    ['S', 0, 0, 0, 0, 0],
-    [1, 0, 1, 1, 1, 0],
-    [1, 0, 1, 'G', 1, 0],
-    [1, 0, 1, 0, 1, 0],
-    [1, 0, 0, 0, 0, 0],
-    [1, 1, 1, 1, 1, 0]
-]
-
-# Coordonnées de départ (0, 0) et d'arrivée (5, 5)
-start_position = (0, 0)
-goal_position = (2, 3)
-
-# Création d'une instance de Maze et Player
-maze = Maze(labyrinthe_grid, start_position, goal_position)
-player = Player(maze)
-
-# Lancement de la recherche du chemin
-player.find_exit()
+if __name__ == "__main__":
+    # Initialisation du labyrinthe (0 = chemin, 1 = mur, 'S' = départ, 'G' = arrivée)
+    labyrinthe_grid = [
+        ['S', 0, 0, 0, 0, 0],
+        [1, 0, 1, 1, 1, 0],
+        [1, 0, 1, 'G', 1, 0],
+        [1, 0, 1, 0, 1, 0],
+        [1, 0, 0, 0, 0, 0],
+        [1, 1, 1, 1, 1, 0]
+    ]
+
+    # Coordonnées de départ (0, 0) et d'arrivée (5, 5)
+    start_position = (0, 0)
+    goal_position = (2, 3)
+
+    # Création d'une instance de Maze et Player
+    maze = Maze(labyrinthe_grid, start_position, goal_position)
+    player = Player(maze)
+
+    # Lancement de la recherche du chemin
+    player.find_exit()
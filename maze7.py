@@ -1,74 +1,270 @@
-import random
-from collections import deque
+import argparse
+import asyncio
+import threading
+from collections import deque, namedtuple
+
+import maze_export
+import maze_kernels
+import maze_profile
+import maze_prune
+from maze_algorithms import ALGORITHMS, connect_to_lattice
+from maze_connectivity import ComponentLabels, DisjointSet, open_cheapest_walls
+from maze_random import BlockRandom, wall_mask
+
+# Déplacements de Player.moves : droite, bas, gauche, haut. Les autres moteurs suivent le
+# même ordre pour explorer les cellules comme le Player
+MOVES = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+WALL_CHARS = bytes.maketrans(b'\x00\x01', b'0#')
+WALL_BYTES = bytes(1 if b == ord('#') else 0 for b in range(256))  # caractère -> 1 pour un mur
+# Octets de la grille à plat du creusement (voir MazeGenerator._padded_cells)
+_WALL, _OPEN, _START, _GOAL, _BORDER = b"#0SG+"
+
+
+def padded_walls(grid):
+    """
+    Masque des murs (1 = mur) de la grille de caractères, entouré d'une bordure
+    d'une case de murs : la cellule (x, y) est à l'indice (x + 1) * (largeur + 2) + y + 1.
+    """
+    stride = len(grid[0]) + 2
+    border = b"\x01" * stride
+    return bytearray(border + b"".join(b"\x01" + "".join(row).encode().translate(WALL_BYTES) + b"\x01"
+                                       for row in grid) + border)
+
+
+# Avancement de la génération : tentative, cellules creusées, taille de la frontière
+ProgressEvent = namedtuple("ProgressEvent", "attempt carved frontier done fallback")
 
 class MazeGenerator:
-    def __init__(self, width, height):
+    max_attempts = 100
+
+    def __init__(self, width, height, seed=None, rng=None, algorithm="prim", kernels=None):
         self.width = width
         self.height = height
+        self.algorithm = algorithm  # "prim" ou un nom de maze_algorithms.ALGORITHMS
+        # Creusement par maze_kernels (None : seulement si Numba est installé) ; même labyrinthe pour une graine
+        self.kernels = maze_kernels.ACCELERATED if kernels is None else kernels
+        # Générateur propre à l'instance : reproductible par graine, sans état global partagé
+        self.rng = rng if rng is not None else BlockRandom(seed)
         self.grid = None
         self.start = (0, 0)
         self.goal = (height - 1, width - 1)
+        self.connectivity = None  # DisjointSet maintenu pendant le creusement
+        self.cancelled = False
+        self.carved = 0
 
     def generate_maze(self):
-        max_attempts = 100
-        for attempt in range(max_attempts):
-            self.grid = [['#' for _ in range(self.width)] for _ in range(self.height)]
-            self.grid[self.start[0]][self.start[1]] = 'S'
-            self.grid[self.goal[0]][self.goal[1]] = 'G'
-            self._generate_paths()
-            
+        for event in self.iter_generate(interval=None):
+            pass
+        if event.fallback:
+            print(f"Échec de génération d'un labyrinthe solvable après {self.max_attempts} tentatives.")
+        elif self.algorithm == "prim":
+            print(f"Labyrinthe solvable généré après {event.attempt} tentatives.")
+
+    def iter_generate(self, interval=10000, cancel=None):
+        """
+        Version pas à pas de generate_maze : produit un ProgressEvent toutes les
+        interval cellules creusées (None = seulement l'événement final done=True).
+        cancel est un objet à méthode is_set() (threading.Event par exemple) consulté
+        à chaque événement ; s'il est levé, la génération s'arrête et self.cancelled
+        passe à True.
+        """
+        self.cancelled = False
+        if self.algorithm != "prim":
+            self._generate_with(ALGORITHMS[self.algorithm])
+            carved = sum(len(row) - row.count('#') for row in self.grid)
+            yield ProgressEvent(1, carved, 0, True, False)
+            return
+        for attempt in range(1, self.max_attempts + 1):
+            self._start_attempt(attempt)
+            for carved, frontier in self._iter_paths(interval):
+                if cancel is not None and cancel.is_set():
+                    self.cancelled = True
+                    return
+                yield ProgressEvent(attempt, carved, frontier, False, False)
+            if cancel is not None and cancel.is_set():
+                self.cancelled = True
+                return
             if self._is_solvable():
-                print(f"Labyrinthe solvable généré après {attempt + 1} tentatives.")
+                yield ProgressEvent(attempt, self.carved, 0, True, False)
                 return
-        
-        print(f"Échec de génération d'un labyrinthe solvable après {max_attempts} tentatives.")
         self._generate_fallback_maze()
+        carved = sum(len(row) - row.count('#') for row in self.grid)
+        yield ProgressEvent(self.max_attempts, carved, 0, True, True)
+
+    async def agenerate(self, interval=10000, cancel=None):
+        """
+        Itérateur asynchrone sur iter_generate : le travail entre deux événements
+        s'exécute dans un thread, la boucle d'événements n'est jamais bloquée.
+        Fermer l'itérateur avant l'événement final (aclose(), par exemple avec
+        contextlib.aclosing) ou annuler la tâche qui l'attend annule la
+        génération : le thread s'arrête au prochain événement et cancelled passe
+        à True. Un simple break sans fermeture ne l'annule qu'à la collecte de
+        l'itérateur.
+        """
+        stop = threading.Event()
+
+        class Cancel:
+            @staticmethod
+            def is_set():
+                return stop.is_set() or (cancel is not None and cancel.is_set())
+
+        loop = asyncio.get_running_loop()
+        events = self.iter_generate(interval, Cancel)
+        done = False
+        try:
+            while True:
+                event = await loop.run_in_executor(None, next, events, None)
+                if event is None:
+                    return
+                done = event.done
+                yield event
+        finally:
+            stop.set()
+            if not done:
+                self.cancelled = True
+
+    def _start_attempt(self, attempt):
+        self.grid = [['#' for _ in range(self.width)] for _ in range(self.height)]
+        self.grid[self.start[0]][self.start[1]] = 'S'
+        self.grid[self.goal[0]][self.goal[1]] = 'G'
 
     def _generate_paths(self):
+        for _ in self._iter_paths(None):
+            pass
+
+    def _iter_paths(self, interval):
+        # Produit (cellules creusées, taille de la frontière) toutes les interval cellules
+        if self.kernels:
+            yield from self._iter_paths_compiled(interval)
+            return
+        self.connectivity = DisjointSet(self.width * self.height)
+        cells = self._padded_cells()
+        # L'arrivée se creuse comme un mur : si elle restait ouverte, deux cellules
+        # creusées pourraient la toucher et fermer une boucle par elle
+        goal = self._padded_index(self.goal)
+        cells[goal] = _WALL
         walls = []
-        self._add_walls(self.start, walls)
+        carved = 0
+        self._add_walls(cells, self._padded_index(self.start), walls)
         while walls:
-            wall = random.choice(walls)
-            walls.remove(wall)
-            x, y = wall
-            if self._can_be_path(x, y):
-                self.grid[x][y] = '0'
-                self._add_walls((x, y), walls)
-
-    def _add_walls(self, cell, walls):
-        x, y = cell
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            nx, ny = x + dx*2, y + dy*2
-            if 0 <= nx < self.height and 0 <= ny < self.width and self.grid[nx][ny] == '#':
-                walls.append((x + dx, y + dy))
-
-    def _can_be_path(self, x, y):
-        count = sum(1 for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                    if 0 <= x+dx < self.height and 0 <= y+dy < self.width and self.grid[x+dx][y+dy] == '0')
-        return count == 1
+            # Tirage d'un mur au hasard puis retrait en O(1) en le remplaçant par le dernier
+            index = self.rng.randbelow(len(walls))
+            i = walls[index]
+            walls[index] = walls[-1]
+            walls.pop()
+            if self._can_be_path(cells, i):
+                cells[i] = _OPEN
+                self._connect(cells, i)
+                self._add_walls(cells, i, walls)
+                carved += 1
+                if interval and carved % interval == 0:
+                    yield carved, len(walls)
+        cells[goal] = _GOAL  # non creusée, l'arrivée reste isolée et _is_solvable échoue
+        self.grid = self._grid_from_cells(cells)
+        self.carved = carved
+
+    def _iter_paths_compiled(self, interval):
+        # Même creusement que _iter_paths, par maze_kernels.carve_prim sur des codes de cellules
+        width, size = self.width, self.width * self.height
+        stride = width + 2
+        cells = maze_kernels.cells_from_grid(self.grid)
+        walls = maze_kernels.int_buffer(4 * size + 4)
+        order = maze_kernels.int_buffer(size)
+        start = self._padded_index(self.start)
+        goal = self._padded_index(self.goal)
+        cells[goal] = maze_kernels.WALL  # creusée comme un mur, voir _iter_paths
+        nwalls = 0
+        for offset in (1, stride, -1, -stride):
+            if cells[start + offset] == maze_kernels.WALL:
+                walls[nwalls] = start + offset
+                nwalls += 1
+        carved = 0
+        while nwalls:
+            block, index = self.rng.word_block()
+            stop_at = (carved // interval + 1) * interval if interval else -1
+            nwalls, index, carved = maze_kernels.carve_prim(cells, stride, walls, nwalls,
+                                                            maze_kernels.words(block), index, carved,
+                                                            order, stop_at)
+            self.rng.consume(int(index))
+            if carved == stop_at:
+                yield carved, nwalls
+        cells[goal] = maze_kernels.GOAL
+        self.grid = maze_kernels.grid_from_cells(cells, width)
+        # Les cellules creusées, l'arrivée comprise si elle l'a été, forment un seul arbre avec le départ
+        members = [(int(i) // stride - 1) * width + int(i) % stride - 1 for i in order[:carved]]
+        self.connectivity = DisjointSet.from_members(size, self.start[0] * width + self.start[1], members)
+        self.carved = carved
+
+    def _padded_cells(self):
+        # Grille à plat entourée d'une bordure _BORDER, ni mur à creuser ni passage : les
+        # voisins d'une cellule (i ± 1, i ± stride) se lisent sans test de bornes
+        edge = bytes([_BORDER])
+        border = edge * (self.width + 2)
+        return bytearray(border + b"".join(edge + "".join(row).encode() + edge for row in self.grid) + border)
+
+    def _grid_from_cells(self, cells):
+        stride = self.width + 2
+        return [list(cells[x * stride + 1:(x + 1) * stride - 1].decode()) for x in range(1, self.height + 1)]
+
+    def _padded_index(self, cell):
+        return (cell[0] + 1) * (self.width + 2) + cell[1] + 1
+
+    def _connect(self, cells, i):
+        # L'index de connexité est en coordonnées publiques : x * largeur + y
+        stride, width = self.width + 2, self.width
+        public = (i // stride - 1) * width + i % stride - 1
+        for offset, step in ((1, 1), (stride, width), (-1, -1), (-stride, -width)):
+            if cells[i + offset] not in (_WALL, _BORDER):
+                self.connectivity.union(public, public + step)
+
+    def _add_walls(self, cells, i, walls):
+        stride = self.width + 2
+        for offset in (1, stride, -1, -stride):  # même ordre que Player.moves
+            if cells[i + offset] == _WALL:
+                walls.append(i + offset)
+
+    def _can_be_path(self, cells, i):
+        stride = self.width + 2
+        return sum(1 for offset in (1, stride, -1, -stride) if cells[i + offset] in (_OPEN, _START)) == 1
 
     def _is_solvable(self):
-        queue = deque([self.start])
-        visited = set([self.start])
-        while queue:
-            x, y = queue.popleft()
-            if (x, y) == self.goal:
-                return True
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.height and 0 <= ny < self.width and (nx, ny) not in visited and self.grid[nx][ny] != '#':
-                    queue.append((nx, ny))
-                    visited.add((nx, ny))
-        return False
+        return self.connectivity.connected(self.start[0] * self.width + self.start[1],
+                                           self.goal[0] * self.width + self.goal[1])
+
+    def _generate_fallback_maze(self, density=0.3, repair=True):
+        # Masque des murs tiré en bloc, puis une conversion en ligne de caractères par rangée.
+        # La réparation étiquette toute la grille en Python (environ 0,5 µs par cellule) : sur
+        # de très grandes grilles, seule la version repair=False reste sous la seconde
+        size = self.width * self.height
+        keep = (self.start[0] * self.width + self.start[1], self.goal[0] * self.width + self.goal[1])
+        self._grid_from_mask(wall_mask(self.rng, size, int(size * density), keep))
+        if repair:
+            self._repair_connectivity()
+        else:
+            self.connectivity = None
+
+    def _generate_with(self, algorithm):
+        # Les algorithmes de maze_algorithms produisent des labyrinthes parfaits, donc solvables
+        mask = algorithm(self.width, self.height, self.rng)
+        self.goal = connect_to_lattice(mask, self.width, self.goal)
+        self._grid_from_mask(mask)
+        self.connectivity = ComponentLabels(self.grid)
 
-    def _generate_fallback_maze(self):
-        self.grid = [['0' for _ in range(self.width)] for _ in range(self.height)]
+    def _grid_from_mask(self, mask):
+        cells = mask.translate(WALL_CHARS)
+        self.grid = [list(cells[x * self.width:(x + 1) * self.width].decode()) for x in range(self.height)]
         self.grid[self.start[0]][self.start[1]] = 'S'
         self.grid[self.goal[0]][self.goal[1]] = 'G'
-        for _ in range(int(self.width * self.height * 0.3)):
-            x, y = random.randint(0, self.height - 1), random.randint(0, self.width - 1)
-            if (x, y) != self.start and (x, y) != self.goal:
-                self.grid[x][y] = '#'
+
+    def _repair_connectivity(self):
+        # Les murs aléatoires peuvent isoler l'arrivée : on ouvre les murs les moins coûteux
+        # Un seul étiquetage : les murs ouverts sont reportés dans les composantes existantes
+        components = ComponentLabels(self.grid)
+        if not components.same_component(self.start, self.goal):
+            for cell in open_cheapest_walls(self.grid, self.start, self.goal, components):
+                components.open(cell)
+        self.connectivity = components
 
     def display(self):
         for row in self.grid:
@@ -76,19 +272,75 @@ class MazeGenerator:
         print()
 
 class Maze:
-    def __init__(self, grid, start, goal):
+    def __init__(self, grid, start, goal, costs=None, connectivity=None):
         self.grid = grid
         self.start = start
-        self.goal = goal
+        # goal est une position ou un ensemble de positions (plusieurs sorties)
+        single = isinstance(goal, tuple) and all(isinstance(v, int) for v in goal)
+        self.goals = frozenset([goal]) if single else frozenset(goal)
+        self.goal = goal if single else min(self.goals)
+        width = len(grid[0])
+        self.goal_mask = bytearray((len(grid) * width + 7) // 8)  # un bit par cellule
+        for x, y in self.goals:
+            i = x * width + y
+            self.goal_mask[i >> 3] |= 1 << (i & 7)
+        self.connectivity = connectivity  # DisjointSet optionnel pour is_reachable
+        self.costs = costs  # coût entier (>= 1) pour entrer dans chaque cellule, None = 1 partout
+        self.revision = 0  # incrémenté à chaque modification des murs
+        self.height, self.width = len(grid), width
+        # Masque des murs entouré d'une bordure de murs, indexé par index(x, y) : les voisins
+        # d'une cellule (index ± 1, index ± stride) y sont toujours, sans test de bornes.
+        # Les murs se modifient par set_wall, qui tient la grille et le masque à jour.
+        self.stride = width + 2
+        self.walls = padded_walls(grid)
+
+    def index(self, x, y):
+        return (x + 1) * self.stride + y + 1
+
+    def position(self, i):
+        x, y = divmod(i, self.stride)
+        return (x - 1, y - 1)
 
     def is_within_bounds(self, x, y):
-        return 0 <= x < len(self.grid) and 0 <= y < len(self.grid[0])
+        return 0 <= x < self.height and 0 <= y < self.width
 
     def is_wall(self, x, y):
-        return self.grid[x][y] == '#'
+        # Vrai aussi sur la bordure, une case autour de la grille
+        return self.walls[(x + 1) * self.stride + y + 1] == 1
 
     def is_goal(self, x, y):
-        return (x, y) == self.goal
+        i = x * self.width + y
+        return (self.goal_mask[i >> 3] >> (i & 7)) & 1 == 1
+
+    def cost(self, x, y):
+        return 1 if self.costs is None else self.costs[x][y]
+
+    def is_reachable(self, a, b):
+        """
+        Test de connexité en temps quasi constant ; True si aucun index n'est disponible.
+        """
+        if self.connectivity is None:
+            return True
+        width = self.width
+        return self.connectivity.connected(a[0] * width + a[1], b[0] * width + b[1])
+
+    def can_reach_goal(self, cell):
+        return any(self.is_reachable(cell, goal) for goal in self.goals)
+
+    def set_wall(self, x, y, wall=True):
+        self.grid[x][y] = '#' if wall else '0'
+        self.walls[self.index(x, y)] = 1 if wall else 0
+        self.revision += 1
+        if self.connectivity is not None:
+            if wall or not isinstance(self.connectivity, DisjointSet):
+                # Un union-find ne sait pas retirer une arête, ni un étiquetage figé se mettre à jour
+                self.connectivity = None
+            else:
+                width = self.width
+                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                    nx, ny = x + dx, y + dy
+                    if not self.is_wall(nx, ny):
+                        self.connectivity.union(x * width + y, nx * width + ny)
 
     def display(self, player_position):
         print("\nLabyrinthe:")
@@ -96,7 +348,7 @@ class Maze:
             for j, cell in enumerate(row):
                 if (i, j) == player_position:
                     print("P", end=" ")
-                elif (i, j) == self.goal:
+                elif self.is_goal(i, j):
                     print("G", end=" ")
                 elif cell == '#':
                     print("#", end=" ")
@@ -110,15 +362,25 @@ class Maze:
         print(f"Position actuelle : {player_position}\n")
 
 class Player:
-    def __init__(self, maze):
+    def __init__(self, maze, stats=None):
         self.maze = maze
         self.visited = set()
-        self.moves = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        self.moves = list(MOVES)
         self.exploration_order = []
         self.order = 0
         self.parents = {}
+        self.stats = stats  # SearchStats optionnel, None = aucune mesure
 
     def bfs(self):
+        if not self.maze.can_reach_goal(self.maze.start):
+            print("Pas de chemin vers la sortie.")
+            return False
+        stats = self.stats
+        if stats is not None:
+            stats.start("search")
+        walls, stride = self.maze.walls, self.maze.stride
+        # Décalage de chaque direction dans le masque bordé : pas de test de bornes
+        neighbours = [(dx, dy, dx * stride + dy) for dx, dy in self.moves]
         queue = deque([self.maze.start])
         self.visited.add(self.maze.start)
         self.order += 1
@@ -127,32 +389,71 @@ class Player:
 
         while queue:
             x, y = queue.popleft()
+            if stats is not None:
+                stats.expansions += 1
             if self.maze.is_goal(x, y):
+                if stats is not None:
+                    stats.stop("search")
                 print(f"Arrivée trouvée à {(x, y)}")
                 self.display_exploration_order()
                 self.total_length_exploration()
                 self.compute_shortest_path((x, y))
+                if stats is not None:
+                    stats.emit()
                 return True
 
-            for dx, dy in self.moves:
+            i = (x + 1) * stride + y + 1
+            for dx, dy, offset in neighbours:
                 nx, ny = x + dx, y + dy
-                if self.maze.is_within_bounds(nx, ny) and not self.maze.is_wall(nx, ny) and (nx, ny) not in self.visited:
+                if stats is not None:
+                    stats.neighbour_checks += 1
+                    if (nx, ny) in self.visited:
+                        stats.revisits += 1
+                if not walls[i + offset] and (nx, ny) not in self.visited:
                     queue.append((nx, ny))
                     self.visited.add((nx, ny))
                     self.maze.grid[nx][ny] = 'x'
-                    self.maze.display((nx, ny))
+                    if stats is None:
+                        self.maze.display((nx, ny))
+                    else:
+                        stats.frontier(len(queue))
+                        stats.start("render")
+                        self.maze.display((nx, ny))
+                        stats.stop("render")
                     self.order += 1
                     self.exploration_order.append((self.order, (nx, ny)))
                     self.parents[(nx, ny)] = (x, y)
 
+        if stats is not None:
+            stats.stop("search")
         print("Pas de chemin vers la sortie.")
         self.display_exploration_order()
         self.total_length_exploration()
+        if stats is not None:
+            stats.emit()
         return False
 
+    def stepwise_bfs(self):
+        """
+        BFS par tranches, sans affichage ni marquage de la grille : voir maze_stepwise.StepwiseBFS.
+        """
+        from maze_stepwise import StepwiseBFS  # maze_stepwise importe maze7
+        return StepwiseBFS(self.maze, self.stats)
+
+    def export_exploration_order(self, path, fmt=None):
+        """
+        Écrit exploration_order en flux (.bin, .npy ou .csv) au lieu de l'afficher :
+        voir maze_export. Retourne le nombre d'étapes écrites.
+        """
+        return maze_export.write_exploration(path, self.exploration_order, fmt)
+
     def display_exploration_order(self):
+        if self.stats is not None:
+            self.stats.start("render")
         print("Chemin d'exploration:")
         print(", ".join(f"{order}({x},{y})" for order, (x, y) in self.exploration_order))
+        if self.stats is not None:
+            self.stats.stop("render")
 
     def total_length_exploration(self):
         print(f"Nombre total de mouvements: {len(self.exploration_order)}")
@@ -162,22 +463,52 @@ class Player:
             print("Pas de chemin vers la sortie.")
 
     def compute_shortest_path(self, goal):
+        if self.stats is not None:
+            self.stats.start("path")
         path = []
         current = goal
         while current:
             path.append(current)
             current = self.parents[current]
         path.reverse()
+        if self.stats is not None:
+            self.stats.stop("path")
         print("Chemin le plus court:")
         print(" -> ".join(f"({x},{y})" for x, y in path) + " -> Arrivée")
+        return path
 
 # Utilisation
-width, height = 40, 30
+def demo(width, height, prune=False, seed=None, algorithm="prim", export=None):
+    maze_generator = MazeGenerator(width, height, seed, algorithm=algorithm)
+    maze_generator.generate_maze()
+    maze_generator.display()
+
+    maze = Maze(maze_generator.grid, maze_generator.start, maze_generator.goal,
+                connectivity=maze_generator.connectivity)
+    if prune:
+        maze = maze_prune.fill_dead_ends(maze)
+        print(f"Impasses remplies : {maze.removed} cellules ({maze.removed_fraction:.1%})")
+    player = Player(maze)
+    player.find_exit()
+    if export:
+        count = player.export_exploration_order(export)
+        print(f"Ordre d'exploration exporté dans {export} ({count} étapes)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génère un labyrinthe puis le résout par BFS.")
+    parser.add_argument("--width", type=int, default=40)
+    parser.add_argument("--height", type=int, default=30)
+    parser.add_argument("--seed", type=int, help="graine du générateur (labyrinthe reproductible)")
+    parser.add_argument("--algorithm", choices=["prim"] + sorted(ALGORITHMS), default="prim")
+    parser.add_argument("--prune", action="store_true", help="remplit les impasses avant la résolution")
+    parser.add_argument("--export-exploration", metavar="FICHIER",
+                        help="exporte l'ordre d'exploration (.bin, .npy ou .csv)")
+    maze_profile.add_arguments(parser)
+    args = parser.parse_args(argv)
+    maze_profile.run(lambda: demo(args.width, args.height, args.prune, args.seed, args.algorithm,
+                                  args.export_exploration), args)
 
-maze_generator = MazeGenerator(width, height)
-maze_generator.generate_maze()
-maze_generator.display()
 
-maze = Maze(maze_generator.grid, maze_generator.start, maze_generator.goal)
-player = Player(maze)
-player.find_exit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
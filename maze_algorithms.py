@@ -0,0 +1,218 @@
+"""
+Algorithmes de génération interchangeables pour MazeGenerator.
+
+Chaque algorithme est une fonction (width, height, rng) -> bytearray : le masque
+compact des murs (1 = mur, 0 = passage) indexé par x * width + y. Les cellules du
+labyrinthe sont aux positions (x, y) paires, les murs entre elles aux positions
+impaires ; le labyrinthe produit est parfait (un seul chemin entre deux cellules).
+"""
+
+ALGORITHMS = {}
+
+
+def register(name):
+    def decorator(func):
+        ALGORITHMS[name] = func
+        return func
+    return decorator
+
+
+def _cell_counts(width, height):
+    return (height + 1) // 2, (width + 1) // 2
+
+
+@register("backtracker")
+def recursive_backtracker(width, height, rng):
+    """
+    Exploration en profondeur avec retour arrière, version itérative (pile explicite).
+    """
+    rows, cols = _cell_counts(width, height)
+    mask = bytearray([1]) * (width * height)
+    visited = bytearray(rows * cols)
+    visited[0] = 1
+    mask[0] = 0
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc) for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                   if 0 <= r + dr < rows and 0 <= c + dc < cols and not visited[(r + dr) * cols + c + dc]]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = options[rng.randbelow(len(options))]
+        visited[nr * cols + nc] = 1
+        mask[(r + nr) * width + c + nc] = 0  # mur entre les deux cellules
+        mask[2 * nr * width + 2 * nc] = 0
+        stack.append((nr, nc))
+    return mask
+
+
+@register("binary_tree")
+def binary_tree(width, height, rng):
+    """
+    Chaque cellule s'ouvre vers le nord ou vers l'ouest. Les choix d'une rangée
+    sont tirés en un bloc d'octets et appliqués par tranches.
+    """
+    rows, cols = _cell_counts(width, height)
+    mask = bytearray([1]) * (width * height)
+    north_table = bytes(1 if b < 128 else 0 for b in range(256))
+    for r in range(rows):
+        row = bytearray([1]) * width
+        row[0::2] = bytes(cols)
+        if r == 0:
+            row[:2 * cols - 1] = bytes(2 * cols - 1)  # première rangée : couloir vers l'ouest
+        else:
+            north = bytearray(rng.randbytes(cols).translate(north_table))
+            north[0] = 1  # première colonne : toujours vers le nord
+            above = bytearray([1]) * width
+            above[0::2] = north.translate(bytes.maketrans(b'\x00\x01', b'\x01\x00'))
+            mask[(2 * r - 1) * width:2 * r * width] = above
+            row[1:2 * cols - 1:2] = north[1:]  # ouest ouvert (0) quand la cellule ne va pas au nord
+        mask[2 * r * width:(2 * r + 1) * width] = row
+    return mask
+
+
+@register("sidewinder")
+def sidewinder(width, height, rng):
+    """
+    Parcours rangée par rangée : les ouvertures vers l'est sont tirées en bloc,
+    puis chaque série de cellules s'ouvre une fois vers le nord.
+    """
+    rows, cols = _cell_counts(width, height)
+    mask = bytearray([1]) * (width * height)
+    east_table = bytes(1 if b < 128 else 0 for b in range(256))
+    for r in range(rows):
+        base = 2 * r * width
+        mask[base:base + 2 * cols - 1:2] = bytes(cols)
+        if r == 0:
+            mask[base:base + 2 * cols - 1] = bytes(2 * cols - 1)
+            continue
+        east = rng.randbytes(cols).translate(east_table)
+        run_start = 0
+        for c in range(cols):
+            if c + 1 < cols and east[c]:
+                mask[base + 2 * c + 1] = 0
+            else:
+                chosen = run_start + rng.randbelow(c - run_start + 1)
+                mask[base - width + 2 * chosen] = 0
+                run_start = c + 1
+    return mask
+
+
+@register("wilson")
+def wilson(width, height, rng):
+    """
+    Marches aléatoires à boucles effacées : labyrinthe parfait tiré uniformément.
+    """
+    rows, cols = _cell_counts(width, height)
+    count = rows * cols
+    mask = bytearray([1]) * (width * height)
+    in_maze = bytearray(count)
+    in_maze[0] = 1
+    mask[0] = 0
+    remaining = count - 1
+    following = [0] * count
+    for start in range(count):
+        if in_maze[start]:
+            continue
+        # Marche aléatoire jusqu'au labyrinthe ; seule la dernière sortie de chaque cellule compte
+        cell = start
+        while not in_maze[cell]:
+            r, c = divmod(cell, cols)
+            options = [n for n, ok in ((cell + 1, c + 1 < cols), (cell + cols, r + 1 < rows),
+                                       (cell - 1, c > 0), (cell - cols, r > 0)) if ok]
+            following[cell] = options[rng.randbelow(len(options))]
+            cell = following[cell]
+        cell = start
+        while not in_maze[cell]:
+            in_maze[cell] = 1
+            remaining -= 1
+            nxt = following[cell]
+            (r, c), (nr, nc) = divmod(cell, cols), divmod(nxt, cols)
+            mask[2 * r * width + 2 * c] = 0
+            mask[(r + nr) * width + c + nc] = 0
+            cell = nxt
+        if not remaining:
+            break
+    return mask
+
+
+@register("division")
+def recursive_division(width, height, rng):
+    """
+    Division récursive (pile explicite) : on part d'une salle ouverte et on la
+    coupe par des murs percés d'une seule ouverture.
+    """
+    rows, cols = _cell_counts(width, height)
+    mask = bytearray([1]) * (width * height)
+    for r in range(2 * rows - 1):
+        line = bytearray(2 * cols - 1)
+        if r % 2:
+            line[1::2] = bytes([1]) * (cols - 1)  # piliers entre quatre cellules
+        mask[r * width:r * width + 2 * cols - 1] = line
+
+    # Chambres en coordonnées de cellules (r0, c0, r1, c1), bornes incluses
+    chambers = [(0, 0, rows - 1, cols - 1)]
+    while chambers:
+        r0, c0, r1, c1 = chambers.pop()
+        tall, wide = r1 - r0, c1 - c0
+        if tall == 0 or wide == 0:
+            continue
+        if tall > wide or (tall == wide and rng.randbelow(2)):
+            # Mur horizontal entre les rangées de cellules cut et cut + 1
+            cut = r0 + rng.randbelow(tall)
+            gap = c0 + rng.randbelow(wide + 1)
+            x = 2 * cut + 1
+            for c in range(c0, c1 + 1):
+                if c != gap:
+                    mask[x * width + 2 * c] = 1
+            chambers.append((r0, c0, cut, c1))
+            chambers.append((cut + 1, c0, r1, c1))
+        else:
+            cut = c0 + rng.randbelow(wide)
+            gap = r0 + rng.randbelow(tall + 1)
+            y = 2 * cut + 1
+            for r in range(r0, r1 + 1):
+                if r != gap:
+                    mask[2 * r * width + y] = 1
+            chambers.append((r0, c0, r1, cut))
+            chambers.append((r0, cut + 1, r1, c1))
+    return mask
+
+
+# Le voisin du dessus d'abord : une arrivée dans le coin inférieur droit se relie
+# comme avant à la cellule paire au-dessus
+_LATTICE_MOVES = [(-1, 0), (0, -1), (1, 0), (0, 1)]
+
+
+def connect_to_lattice(mask, width, cell):
+    """
+    Rend cell accessible sans créer de boucle dans un labyrinthe parfait et
+    retourne la cellule d'arrivée retenue. Une cellule murée n'est ouverte que si
+    elle devient une impasse : elle touche une seule cellule ouverte, ou aucune
+    mais un mur voisin (passage du bord) qui en touche une seule et qu'on ouvre
+    avec elle. Sinon (passage entre deux cellules du treillis, pilier entouré de
+    passages ouverts) l'arrivée est ramenée à la cellule paire voisine.
+    """
+    height = len(mask) // width
+
+    def open_neighbours(x, y):
+        return sum(1 for dx, dy in _LATTICE_MOVES
+                   if 0 <= x + dx < height and 0 <= y + dy < width and not mask[(x + dx) * width + y + dy])
+
+    x, y = cell
+    if not mask[x * width + y]:
+        return cell
+    count = open_neighbours(x, y)
+    if count == 1:
+        mask[x * width + y] = 0
+        return cell
+    if count == 0:
+        for dx, dy in _LATTICE_MOVES:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < height and 0 <= ny < width and open_neighbours(nx, ny) == 1:
+                mask[nx * width + ny] = 0
+                mask[x * width + y] = 0
+                return cell
+    return (x - x % 2, y - y % 2)
+
@@ -0,0 +1,132 @@
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from maze7 import MOVES
+
+UNREACHABLE = 0xFFFF
+NO_MOVE = 0xFF
+
+# Budget mémoire par défaut de la table : 3 octets par paire de cellules ouvertes
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+_worker_neighbours = None
+
+
+def _init_worker(neighbours):
+    global _worker_neighbours
+    _worker_neighbours = neighbours
+
+
+def _rows_for_targets(neighbours, targets):
+    """
+    Une BFS par cible : distance de chaque cellule à la cible (uint16) et
+    direction du premier pas vers la cible (indice dans MOVES).
+    """
+    count = len(neighbours) // 4
+    distances = array('H')
+    next_moves = bytearray()
+    for target in targets:
+        row = array('H', [UNREACHABLE]) * count
+        moves = bytearray([NO_MOVE]) * count
+        row[target] = 0
+        queue = deque([target])
+        while queue:
+            cell = queue.popleft()
+            distance = row[cell] + 1
+            base = 4 * cell
+            for k in range(4):
+                neighbour = neighbours[base + k]
+                if neighbour >= 0 and row[neighbour] == UNREACHABLE:
+                    row[neighbour] = distance
+                    moves[neighbour] = (k + 2) % 4  # direction opposée : du voisin vers cell
+                    queue.append(neighbour)
+        distances.extend(row)
+        next_moves.extend(moves)
+    return distances.tobytes(), bytes(next_moves)
+
+
+def _worker_rows(targets):
+    return _rows_for_targets(_worker_neighbours, targets)
+
+
+class DistanceTable:
+    """
+    Table précalculée des distances entre toutes les paires de cellules ouvertes
+    (uint16) et du prochain pas vers chaque cible. Une requête se résout par une
+    lecture dans la table puis le parcours du chemin.
+
+    La table occupe 3 * n * n octets pour n cellules ouvertes (2 pour la distance,
+    1 pour le prochain pas) : au plus 4,3 Mo pour un labyrinthe 40x30 (1200 cellules
+    toutes ouvertes), environ 1,6 Mo pour un labyrinthe de Prim de cette taille
+    (quelque 730 cellules ouvertes). La construction est refusée (ValueError) si
+    ce volume dépasse memory_budget, ou si n dépasse 65535 (limite des distances
+    sur 16 bits).
+    """
+
+    def __init__(self, maze, processes=None, memory_budget=DEFAULT_MEMORY_BUDGET, chunk_size=64):
+        height, width = len(maze.grid), len(maze.grid[0])
+        self.width = width
+        self.cells = [(x, y) for x in range(height) for y in range(width) if not maze.is_wall(x, y)]
+        count = len(self.cells)
+        if count > UNREACHABLE:
+            raise ValueError(f"Trop de cellules ouvertes ({count}) pour des distances sur 16 bits")
+        required = self.memory_required(count)
+        if required > memory_budget:
+            raise ValueError(f"Table de {required} octets refusée (budget {memory_budget} octets)")
+
+        self.ids = array('i', [-1]) * (height * width)
+        for i, (x, y) in enumerate(self.cells):
+            self.ids[x * width + y] = i
+        self.neighbours = array('i', [-1]) * (4 * count)
+        for i, (x, y) in enumerate(self.cells):
+            for k, (dx, dy) in enumerate(MOVES):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < height and 0 <= ny < width:
+                    self.neighbours[4 * i + k] = self.ids[nx * width + ny]
+
+        chunks = [range(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+        self.distances = array('H')
+        self.next_moves = bytearray()
+        if processes is None or processes <= 1:
+            results = (_rows_for_targets(self.neighbours, chunk) for chunk in chunks)
+            self._store(results)
+        else:
+            with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(self.neighbours,)) as pool:
+                self._store(pool.map(_worker_rows, chunks))
+
+    @staticmethod
+    def memory_required(open_cells):
+        return 3 * open_cells * open_cells
+
+    def _store(self, results):
+        for distances, next_moves in results:
+            self.distances.frombytes(distances)
+            self.next_moves.extend(next_moves)
+
+    def _id(self, cell):
+        i = self.ids[cell[0] * self.width + cell[1]]
+        if i < 0:
+            raise ValueError(f"{cell} n'est pas une cellule ouverte")
+        return i
+
+    def distance(self, start, goal):
+        """
+        Distance la plus courte entre start et goal, None si goal est inaccessible.
+        """
+        distance = self.distances[self._id(goal) * len(self.cells) + self._id(start)]
+        return None if distance == UNREACHABLE else distance
+
+    def path(self, start, goal):
+        """
+        Chemin le plus court de start à goal (liste de positions), None si inaccessible.
+        """
+        target, cell = self._id(goal), self._id(start)
+        row = target * len(self.cells)
+        if self.distances[row + cell] == UNREACHABLE:
+            return None
+        path = [self.cells[cell]]
+        while cell != target:
+            cell = self.neighbours[4 * cell + self.next_moves[row + cell]]
+            path.append(self.cells[cell])
+        return path
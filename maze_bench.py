@@ -0,0 +1,140 @@
+import argparse
+import contextlib
+import io
+import time
+
+import maze_harness
+from maze7 import Maze, MazeGenerator
+from maze_algorithms import ALGORITHMS
+from maze_hpa import HierarchicalPlanner
+from maze_random import BlockRandom
+from maze_stepwise import StepwiseBFS
+
+
+def bench_generators(width, height, repeat, seed):
+    """
+    Mesure le débit (cellules par seconde) de chaque algorithme de génération.
+    """
+    cells = width * height
+    print(f"{'algorithme':<12} {'meilleur (s)':>12} {'cellules/s':>14}")
+    for name in ["prim"] + sorted(ALGORITHMS):
+        best = None
+        for attempt in range(repeat):
+            generator = MazeGenerator(width, height, seed + attempt, algorithm=name)
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator.generate_maze()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:<12} {best:>12.4f} {cells / best:>14,.0f}")
+
+
+def bench_solvers(width, height, seeds, repeat, names=None, baseline="maze7.bfs"):
+    """
+    Mesure chaque solveur sur le même corpus (maze_harness.corpus) : meilleur
+    temps total sur repeat passes, débit en résolutions par seconde et rapport
+    au solveur de référence.
+    """
+    cases = list(maze_harness.corpus(range(seeds), width, height))
+    timings = {}
+    for name in names or maze_harness.SOLVERS:
+        solver = maze_harness.SOLVERS[name]
+        best = None
+        for attempt in range(repeat):
+            solved = 0
+            started = time.perf_counter()
+            for case in cases:
+                solved += maze_harness.run_solver(solver, case) is not None
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = (best, solved)
+    reference = timings[baseline][0] if baseline in timings else None
+    print(f"{len(cases)} labyrinthes {width}x{height}")
+    print(f"{'solveur':<14} {'cas':>5} {'meilleur (s)':>12} {'résolutions/s':>14} {'vs ' + baseline:>16}")
+    for name, (best, solved) in timings.items():
+        if not solved:
+            print(f"{name:<14} {0:>5} {'ignoré (labyrinthes trop grands)':>44}")
+            continue
+        ratio = f"{reference / best:>15.2f}x" if reference else f"{'-':>16}"
+        print(f"{name:<14} {solved:>5} {best:>12.4f} {solved / best:>14,.1f} {ratio}")
+
+
+def bench_hierarchy(width, height, cluster_size, queries, seed, algorithm="backtracker"):
+    """
+    Compare HierarchicalPlanner à la BFS à plat sur des paires de cellules
+    tirées au hasard : temps de construction, temps moyen par requête,
+    mise à jour après un changement de mur et allongement moyen des chemins.
+    """
+    generator = MazeGenerator(width, height, seed, algorithm=algorithm)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.generate_maze()
+    maze = Maze(generator.grid, generator.start, generator.goal)
+    started = time.perf_counter()
+    planner = HierarchicalPlanner(maze, cluster_size)
+    built = time.perf_counter() - started
+
+    rng = BlockRandom(seed)
+    open_cells = [(x, y) for x in range(height) for y in range(width) if not maze.is_wall(x, y)]
+    pairs = [(open_cells[rng.randbelow(len(open_cells))], open_cells[rng.randbelow(len(open_cells))])
+             for _ in range(queries)]
+    hierarchical = flat = 0.0
+    stretch = []
+    for start, goal in pairs:
+        started = time.perf_counter()
+        path = planner.find_path(start, goal)
+        hierarchical += time.perf_counter() - started
+        started = time.perf_counter()
+        search = StepwiseBFS(Maze(maze.grid, start, goal))
+        search.run()
+        shortest = search.path()
+        flat += time.perf_counter() - started
+        if shortest is not None and len(shortest) > 1:
+            stretch.append((len(path) - 1) / (len(shortest) - 1))
+
+    x, y = open_cells[rng.randbelow(len(open_cells))]
+    started = time.perf_counter()
+    planner.set_wall(x, y)
+    updated = time.perf_counter() - started
+    planner.clear_wall(x, y)
+
+    print(f"{width}x{height}, blocs de {cluster_size}, {len(planner.intra)} blocs, "
+          f"{sum(len(edges) for edges in planner.intra.values())} entrées")
+    print(f"construction : {built:.3f} s ; mise à jour d'un mur : {updated * 1000:.2f} ms")
+    print(f"requête HPA* : {hierarchical / queries * 1000:.2f} ms ; BFS à plat : {flat / queries * 1000:.2f} ms")
+    if stretch:
+        print(f"allongement moyen : {sum(stretch) / len(stretch):.3f} (max {max(stretch):.3f})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bancs d'essai des générateurs et des solveurs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    generators = commands.add_parser("generators", help="débit de chaque algorithme de génération")
+    generators.add_argument("--width", type=int, default=200)
+    generators.add_argument("--height", type=int, default=200)
+    generators.add_argument("--repeat", type=int, default=3)
+    generators.add_argument("--seed", type=int, default=0)
+    solvers = commands.add_parser("solvers", help="débit de chaque solveur sur un corpus commun")
+    solvers.add_argument("--width", type=int, default=61)
+    solvers.add_argument("--height", type=int, default=61)
+    solvers.add_argument("--seeds", type=int, default=2)
+    solvers.add_argument("--repeat", type=int, default=3)
+    solvers.add_argument("--solver", action="append", choices=sorted(maze_harness.SOLVERS),
+                         help="limite le banc à ces solveurs (option répétable)")
+    hierarchy = commands.add_parser("hierarchy", help="HPA* contre la BFS à plat sur de grands labyrinthes")
+    hierarchy.add_argument("--width", type=int, default=501)
+    hierarchy.add_argument("--height", type=int, default=501)
+    hierarchy.add_argument("--cluster-size", type=int, default=16)
+    hierarchy.add_argument("--queries", type=int, default=20)
+    hierarchy.add_argument("--seed", type=int, default=0)
+    hierarchy.add_argument("--algorithm", choices=["prim"] + sorted(ALGORITHMS), default="backtracker")
+    args = parser.parse_args(argv)
+    if args.command == "generators":
+        bench_generators(args.width, args.height, args.repeat, args.seed)
+    elif args.command == "solvers":
+        bench_solvers(args.width, args.height, args.seeds, args.repeat, args.solver)
+    elif args.command == "hierarchy":
+        bench_hierarchy(args.width, args.height, args.cluster_size, args.queries, args.seed, args.algorithm)
+
+
+if __name__ == "__main__":
+    main()
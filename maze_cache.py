@@ -0,0 +1,250 @@
+import contextlib
+import hashlib
+import io
+import sqlite3
+import time
+from array import array
+
+from maze_stepwise import StepwiseBFS
+from maze_weighted import DialPlayer
+
+# Grille de caractères -> masque compact (1 = mur)
+_WALL_BYTES = bytes(1 if b == ord('#') else 0 for b in range(256))
+
+# Les 8 symétries du carré : (transposition, retournement des rangées, retournement des colonnes)
+SYMMETRIES = [(t, r, c) for t in (False, True) for r in (False, True) for c in (False, True)]
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def grid_mask(maze):
+    """
+    Masque compact des murs d'un Maze, indexé par x * largeur + y.
+    """
+    return "".join("".join(row) for row in maze.grid).encode().translate(_WALL_BYTES)
+
+
+def transform_mask(mask, width, height, symmetry):
+    """
+    Applique une symétrie au masque. Retourne (masque, largeur, hauteur) : une
+    transposition échange les dimensions.
+    """
+    transpose, flip_rows, flip_cols = symmetry
+    if transpose:
+        rows = [mask[y::width] for y in range(width)]  # la colonne y devient la rangée y
+        width, height = height, width
+    else:
+        rows = [mask[x * width:(x + 1) * width] for x in range(height)]
+    if flip_rows:
+        rows.reverse()
+    if flip_cols:
+        rows = [row[::-1] for row in rows]
+    return b"".join(rows), width, height
+
+
+def transform_cell(cell, width, height, symmetry):
+    """
+    Position de cell après la symétrie (width et height : dimensions avant la symétrie).
+    """
+    transpose, flip_rows, flip_cols = symmetry
+    x, y = cell
+    if transpose:
+        x, y = y, x
+        width, height = height, width
+    if flip_rows:
+        x = height - 1 - x
+    if flip_cols:
+        y = width - 1 - y
+    return (x, y)
+
+
+def inverse_cell(cell, width, height, symmetry):
+    """
+    Inverse de transform_cell : position d'origine d'une cellule transformée.
+    """
+    transpose, flip_rows, flip_cols = symmetry
+    x, y = cell
+    out_width, out_height = (height, width) if transpose else (width, height)
+    if flip_cols:
+        y = out_width - 1 - y
+    if flip_rows:
+        x = out_height - 1 - x
+    return (y, x) if transpose else (x, y)
+
+
+def grid_hash(mask, width, height, costs=b""):
+    """
+    Empreinte BLAKE2b (16 octets) du masque, de ses dimensions et des coûts par
+    cellule (octets vides si le labyrinthe n'en a pas).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(width.to_bytes(4, "little") + height.to_bytes(4, "little"))
+    digest.update(mask)
+    digest.update(len(costs).to_bytes(4, "little"))
+    digest.update(costs)
+    return digest.digest()
+
+
+def default_solver(maze):
+    """
+    Nom du solveur utilisé par SolveCache.solve sans solveur explicite : Dial
+    si le labyrinthe a des coûts par cellule, BFS sinon.
+    """
+    return "bfs" if getattr(maze, "costs", None) is None else "dial"
+
+
+def canonical_key(maze, symmetric=None, solver=None):
+    """
+    Clé de cache d'une requête (solveur, labyrinthe et ses coûts, départ,
+    arrivées). solver est le nom du solveur qui calcule le chemin (par défaut
+    default_solver(maze)) : deux solveurs ne partagent pas leurs entrées. Avec
+    symmetric (par défaut : sauf si le labyrinthe a des coûts par cellule), la
+    clé est la plus petite sur les 8 symétries, ce qui confond un labyrinthe et
+    ses images miroir ou tournées. Retourne (clé, symétrie appliquée).
+    """
+    height, width = len(maze.grid), len(maze.grid[0])
+    mask = grid_mask(maze)
+    costs = getattr(maze, "costs", None)
+    if costs is not None:
+        costs = array('i', [cost for row in costs for cost in row])
+    if symmetric is None:
+        symmetric = costs is None
+    tag = hashlib.blake2b((solver or default_solver(maze)).encode(), digest_size=8).digest()
+    best = None
+    for symmetry in (SYMMETRIES if symmetric else SYMMETRIES[:1]):
+        variant, w, h = transform_mask(mask, width, height, symmetry)
+        cost_bytes = b"" if costs is None else transform_mask(costs, width, height, symmetry)[0]
+        start = transform_cell(maze.start, width, height, symmetry)
+        goals = sorted(transform_cell(goal, width, height, symmetry) for goal in maze.goals)
+        key = (tag + grid_hash(variant, w, h, cost_bytes)
+               + array('i', [*start, *(v for goal in goals for v in goal)]).tobytes())
+        if best is None or key < best[0]:
+            best = (key, symmetry)
+    return best
+
+
+def _bfs_path(maze):
+    search = StepwiseBFS(maze)
+    search.run()
+    return search.path()
+
+
+def _dial_path(maze):
+    """
+    Plus court chemin pondéré par maze.costs (DialPlayer), sans son affichage ;
+    la grille du labyrinthe, que la recherche marque, est rétablie ensuite.
+    """
+    saved = [row[:] for row in maze.grid]
+    player = DialPlayer(maze)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if not player.dijkstra():
+                return None
+            return player.compute_shortest_path(player.exploration_order[-1][1])  # arrivée atteinte
+    finally:
+        for row, original in zip(maze.grid, saved):
+            row[:] = original
+
+
+SOLVERS = {"bfs": _bfs_path, "dial": _dial_path}
+
+
+class SolveCache:
+    """
+    Cache persistant (SQLite) des chemins, indexé par canonical_key :
+    une requête déjà résolue, ou l'image miroir ou tournée d'une requête résolue,
+    ne relance pas la recherche. Au-delà de max_bytes de chemins stockés, les
+    entrées les moins récemment utilisées sont évincées.
+    """
+
+    def __init__(self, filename="maze_cache.sqlite", max_bytes=DEFAULT_MAX_BYTES):
+        self.db = sqlite3.connect(filename)
+        self.db.execute("CREATE TABLE IF NOT EXISTS solves ("
+                        "key BLOB PRIMARY KEY, found INTEGER, path BLOB, size INTEGER, used REAL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS solves_used ON solves (used)")
+        self.max_bytes = max_bytes
+        self.size = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM solves").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, maze, solver=None):
+        """
+        Retourne (True, chemin) si la requête est en cache pour ce solveur (chemin
+        None : arrivée inaccessible), (False, None) sinon.
+        """
+        return self._lookup(maze, *canonical_key(maze, solver=solver))
+
+    def store(self, maze, path, solver=None):
+        """
+        Enregistre le chemin (None si l'arrivée est inaccessible) calculé par le
+        solveur nommé solver, en coordonnées canoniques.
+        """
+        self._store(maze, path, *canonical_key(maze, solver=solver))
+
+    def solve(self, maze, solver=None, name=None):
+        """
+        Chemin du départ à l'arrivée, pris dans le cache ou calculé par
+        solver(maze) puis enregistré. Sans solver, le plus court chemin : Dial si
+        le labyrinthe a des coûts par cellule, BFS sinon. Un solveur explicite est
+        mis en cache sous name (son nom qualifié par défaut), pour ne jamais servir
+        le chemin d'un autre solveur. None si l'arrivée est inaccessible.
+        """
+        if solver is None:
+            name = default_solver(maze)
+            solver = SOLVERS[name]
+        elif name is None:
+            name = f"{solver.__module__}.{getattr(solver, '__qualname__', type(solver).__qualname__)}"
+        key, symmetry = canonical_key(maze, solver=name)
+        hit, path = self._lookup(maze, key, symmetry)
+        if hit:
+            return path
+        path = solver(maze)
+        self._store(maze, path, key, symmetry)
+        return path
+
+    def _lookup(self, maze, key, symmetry):
+        row = self.db.execute("SELECT found, path FROM solves WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self.db.execute("UPDATE solves SET used = ? WHERE key = ?", (time.time(), key))
+        self.db.commit()
+        if not row[0]:
+            return True, None
+        values = array('i')
+        values.frombytes(row[1])
+        height, width = len(maze.grid), len(maze.grid[0])
+        return True, [inverse_cell((values[k], values[k + 1]), width, height, symmetry)
+                      for k in range(0, len(values), 2)]
+
+    def _store(self, maze, path, key, symmetry):
+        height, width = len(maze.grid), len(maze.grid[0])
+        data = b"" if path is None else array(
+            'i', [v for cell in path for v in transform_cell(cell, width, height, symmetry)]).tobytes()
+        previous = self.db.execute("SELECT size FROM solves WHERE key = ?", (key,)).fetchone()
+        self.db.execute("INSERT OR REPLACE INTO solves VALUES (?, ?, ?, ?, ?)",
+                        (key, path is not None, data, len(key) + len(data), time.time()))
+        self.size += len(key) + len(data) - (previous[0] if previous else 0)
+        if self.size > self.max_bytes:
+            self._evict()
+        self.db.commit()
+
+    def _evict(self):
+        # Entrées les moins récemment utilisées d'abord, jusqu'à repasser sous max_bytes
+        victims = []
+        for key, size in self.db.execute("SELECT key, size FROM solves ORDER BY used"):
+            if self.size <= self.max_bytes:
+                break
+            victims.append((key,))
+            self.size -= size
+        self.db.executemany("DELETE FROM solves WHERE key = ?", victims)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,230 @@
+from array import array
+from collections import deque
+
+# Grille de caractères -> masque (1 = mur) ; 2 marque la bordure ajoutée autour de la grille
+_WALL_BYTES = bytes(1 if b == ord('#') else 0 for b in range(256))
+_BORDER = 2
+
+
+class DisjointSet:
+    """
+    Union-find sur les indices à plat (x * largeur + y) des cellules d'une grille.
+    """
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    @classmethod
+    def from_grid(cls, grid):
+        """
+        Construit l'index de connexité d'une grille existante en un seul balayage.
+        """
+        height, width = len(grid), len(grid[0])
+        index = cls(height * width)
+        for x in range(height):
+            row = grid[x]
+            below = grid[x + 1] if x + 1 < height else None
+            for y in range(width):
+                if row[y] == '#':
+                    continue
+                i = x * width + y
+                if y + 1 < width and row[y + 1] != '#':
+                    index.union(i, i + 1)
+                if below is not None and below[y] != '#':
+                    index.union(i, i + width)
+        return index
+
+    @classmethod
+    def from_members(cls, size, root, members):
+        """
+        Index où root et les indices de members (distincts de root) forment un
+        seul ensemble, toutes les autres cellules restant isolées.
+        """
+        index = cls(size)
+        parent = index.parent
+        count = 0
+        for i in members:
+            parent[i] = root
+            count += 1
+        index.size[root] += count
+        return index
+
+    def add(self):
+        """
+        Ajoute un nouvel ensemble singleton et retourne son indice.
+        """
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        return len(self.parent) - 1
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i == root_j:
+            return root_i
+        if self.size[root_i] < self.size[root_j]:
+            root_i, root_j = root_j, root_i
+        self.parent[root_j] = root_i
+        self.size[root_i] += self.size[root_j]
+        return root_i
+
+    def connected(self, i, j):
+        return self.find(i) == self.find(j)
+
+
+class ComponentLabels:
+    """
+    Étiquetage des composantes connexes d'une grille (0 = mur, 1..n = composante).
+    labels est un tableau à plat indexé par x * largeur + y, sizes[k] la taille de la composante k.
+    open() tient l'étiquetage à jour quand un mur est ouvert : les étiquettes
+    réunies restent dans labels et merged les regroupe (find donne l'étiquette
+    représentante, dont sizes garde la taille).
+    """
+
+    def __init__(self, grid):
+        height, width = len(grid), len(grid[0])
+        self.width = width
+        self.height = height
+        self.labels = labels = array('i', bytes(4 * height * width))
+        equivalences = DisjointSet(1)
+
+        # Premier passage : étiquettes provisoires à partir des voisins haut et gauche
+        i = 0
+        for x in range(height):
+            row = grid[x]
+            for y in range(width):
+                if row[y] != '#':
+                    up = labels[i - width] if x > 0 else 0
+                    left = labels[i - 1] if y > 0 else 0
+                    if up and left:
+                        labels[i] = left
+                        if up != left:
+                            equivalences.union(up, left)
+                    else:
+                        labels[i] = up or left or equivalences.add()
+                i += 1
+
+        # Second passage : résolution des équivalences en étiquettes compactes
+        compact = array('i', bytes(4 * len(equivalences.parent)))
+        self.sizes = [0]
+        for i in range(len(labels)):
+            label = labels[i]
+            if label:
+                root = equivalences.find(label)
+                if not compact[root]:
+                    compact[root] = len(self.sizes)
+                    self.sizes.append(0)
+                labels[i] = compact[root]
+                self.sizes[compact[root]] += 1
+        self.merged = DisjointSet(len(self.sizes))
+        self._merges = 0
+
+    @property
+    def count(self):
+        return len(self.sizes) - 1 - self._merges
+
+    def component_of(self, cell):
+        label = self.labels[cell[0] * self.width + cell[1]]
+        return self.merged.find(label) if label else 0
+
+    def connected(self, i, j):
+        """
+        Même interface que DisjointSet.connected.
+        """
+        a, b = self.labels[i], self.labels[j]
+        return a != 0 and b != 0 and (a == b or self.merged.find(a) == self.merged.find(b))
+
+    def open(self, cell):
+        """
+        Enregistre l'ouverture du mur cell : nouvelle composante d'une cellule,
+        réunie à celles de ses voisins ouverts.
+        """
+        x, y = cell
+        i = x * self.width + y
+        if self.labels[i]:
+            return
+        label = self.labels[i] = self.merged.add()
+        self.sizes.append(1)
+        for nx, ny, j in ((x, y + 1, i + 1), (x + 1, y, i + self.width), (x, y - 1, i - 1), (x - 1, y, i - self.width)):
+            if 0 <= nx < self.height and 0 <= ny < self.width and self.labels[j]:
+                a, b = self.merged.find(label), self.merged.find(self.labels[j])
+                if a != b:
+                    root = self.merged.union(a, b)
+                    self.sizes[root] = self.sizes[a] + self.sizes[b]
+                    self._merges += 1
+
+    def same_component(self, a, b):
+        return self.connected(a[0] * self.width + a[1], b[0] * self.width + b[1])
+
+
+def open_cheapest_walls(grid, start, goal, components=None):
+    """
+    Ouvre le plus petit nombre de murs reliant start à goal (BFS 0-1 sur la
+    grille à plat bordée : entrer dans un mur coûte 1, dans une cellule ouverte 0).
+    Avec components (ComponentLabels de la grille), la recherche part de la plus
+    petite des deux composantes et s'arrête à la première cellule de l'autre,
+    sans parcourir celle-ci. Retourne la liste des murs ouverts ; components
+    n'est pas mis à jour (voir ComponentLabels.open).
+    """
+    width = len(grid[0])
+    stride = width + 2
+    border = bytes([_BORDER])
+    walls = bytearray(border * stride + b"".join(border + "".join(row).encode().translate(_WALL_BYTES) + border
+                                                 for row in grid) + border * stride)
+    if components is not None and components.sizes[components.component_of(start)] > \
+            components.sizes[components.component_of(goal)]:
+        start, goal = goal, start
+    source = (start[0] + 1) * stride + start[1] + 1
+    if components is None:
+        target_labels = None
+        target = (goal[0] + 1) * stride + goal[1] + 1
+    else:
+        labels, root = components.labels, components.component_of(goal)
+        target_labels = {label for label in range(1, len(components.sizes))
+                         if components.merged.find(label) == root}
+    distances = array('i', [-1]) * len(walls)
+    parents = array('i', [-1]) * len(walls)
+    distances[source] = 0
+    queue = deque([source])
+    offsets = (1, stride, -1, -stride)
+    reached = -1
+    while queue:
+        i = queue.popleft()
+        if target_labels is None:
+            if i == target:
+                reached = i
+                break
+        elif labels[(i // stride - 1) * width + i % stride - 1] in target_labels:
+            reached = i
+            break
+        distance = distances[i]
+        for offset in offsets:
+            j = i + offset
+            weight = walls[j]
+            if weight == _BORDER:
+                continue
+            candidate = distance + weight
+            if distances[j] < 0 or candidate < distances[j]:
+                distances[j] = candidate
+                parents[j] = i
+                if weight:
+                    queue.append(j)
+                else:
+                    queue.appendleft(j)
+
+    opened = []
+    i = reached
+    while i >= 0:
+        if walls[i]:
+            x, y = divmod(i, stride)
+            grid[x - 1][y - 1] = '0'
+            opened.append((x - 1, y - 1))
+        i = parents[i]
+    return opened
@@ -0,0 +1,116 @@
+import heapq
+
+from maze7 import MOVES
+
+INF = float("inf")
+
+
+class IncrementalPlanner:
+    """
+    Planificateur incrémental (Lifelong Planning A*) entre maze.start et maze.goal.
+    Après set_wall / clear_wall, seuls les sommets dont la distance change sont
+    retraités par current_path. Une seule arrivée : l'heuristique et l'arrêt
+    portent sur maze.goal.
+    """
+
+    def __init__(self, maze):
+        if len(maze.goals) > 1:
+            raise ValueError(f"IncrementalPlanner ne gère qu'une arrivée ({len(maze.goals)} données)")
+        self.maze = maze
+        self.neighbour_offsets = [(dx, dy, dx * maze.stride + dy) for dx, dy in MOVES]  # masque bordé
+        self.g = {}
+        self.rhs = {maze.start: 0}
+        self.open = {}  # sommet -> clé courante dans la file
+        self.queue = []
+        self.expansions = 0
+        self._push(maze.start)
+
+    def _heuristic(self, cell):
+        gx, gy = self.maze.goal
+        return abs(cell[0] - gx) + abs(cell[1] - gy)
+
+    def _key(self, cell):
+        best = min(self.g.get(cell, INF), self.rhs.get(cell, INF))
+        return (best + self._heuristic(cell), best)
+
+    def _push(self, cell):
+        key = self._key(cell)
+        self.open[cell] = key
+        heapq.heappush(self.queue, (key, cell))
+
+    def _top_key(self):
+        while self.queue:
+            key, cell = self.queue[0]
+            if self.open.get(cell) == key:
+                return key
+            heapq.heappop(self.queue)
+        return (INF, INF)
+
+    def _neighbours(self, cell):
+        # Voisins ouverts : la bordure de Maze.walls tient lieu de test de bornes, et un
+        # mur n'est jamais le prédécesseur d'une cellule (son rhs est infini)
+        x, y = cell
+        walls, i = self.maze.walls, self.maze.index(x, y)
+        for dx, dy, offset in self.neighbour_offsets:
+            if not walls[i + offset]:
+                yield (x + dx, y + dy)
+
+    def _edge_cost(self, cell):
+        """
+        Coût pour entrer dans cell (infini pour un mur).
+        """
+        if self.maze.is_wall(*cell):
+            return INF
+        return self.maze.cost(*cell)
+
+    def _update_vertex(self, cell):
+        if cell != self.maze.start:
+            cost = self._edge_cost(cell)
+            if cost == INF:
+                self.rhs[cell] = INF
+            else:
+                self.rhs[cell] = min((self.g.get(p, INF) for p in self._neighbours(cell)), default=INF) + cost
+        self.open.pop(cell, None)
+        if self.g.get(cell, INF) != self.rhs.get(cell, INF):
+            self._push(cell)
+
+    def _compute_shortest_path(self):
+        goal = self.maze.goal
+        while self._top_key() < self._key(goal) or self.rhs.get(goal, INF) != self.g.get(goal, INF):
+            _, cell = heapq.heappop(self.queue)
+            del self.open[cell]
+            self.expansions += 1
+            if self.g.get(cell, INF) > self.rhs.get(cell, INF):
+                self.g[cell] = self.rhs[cell]
+            else:
+                self.g[cell] = INF
+                self._update_vertex(cell)
+            for neighbour in self._neighbours(cell):
+                self._update_vertex(neighbour)
+
+    def set_wall(self, x, y):
+        self.maze.set_wall(x, y, True)
+        self._update_vertex((x, y))
+
+    def clear_wall(self, x, y):
+        self.maze.set_wall(x, y, False)
+        self._update_vertex((x, y))
+
+    def current_cost(self):
+        self._compute_shortest_path()
+        return self.g.get(self.maze.goal, INF)
+
+    def current_path(self):
+        """
+        Retourne le chemin le plus court courant (liste de positions) ou None.
+        """
+        if self.current_cost() == INF:
+            return None
+        start = self.maze.start
+        cell = self.maze.goal
+        path = [cell]
+        while cell != start:
+            cell = min(self._neighbours(cell), key=lambda p: self.g.get(p, INF))
+            path.append(cell)
+        path.reverse()
+        return path
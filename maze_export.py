@@ -0,0 +1,136 @@
+import os
+import struct
+import sys
+from array import array
+from itertools import islice
+
+FORMATS = ("bin", "npy", "csv")
+BINARY_MAGIC = b"MAZEXPL1"  # suivi de triplets int32 petit-boutistes (ordre, x, y)
+CHUNK_SIZE = 1 << 16
+_STEP = struct.Struct("<3i")  # une étape (ordre, x, y) en int32 petit-boutistes
+
+# En-tête .npy de taille fixe, réécrit à la fermeture avec le nombre de lignes réel
+_NPY_HEADER_SIZE = 128
+_NPY_DICT = "{{'descr': '<i4', 'fortran_order': False, 'shape': ({}, 3), }}"
+
+
+def _format_of(path, fmt):
+    fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Format d'export inconnu : {fmt!r} (attendu : {', '.join(FORMATS)})")
+    return fmt
+
+
+def _npy_header(count):
+    text = _NPY_DICT.format(count)
+    padding = _NPY_HEADER_SIZE - 10 - len(text) - 1
+    return b"\x93NUMPY\x01\x00" + (_NPY_HEADER_SIZE - 10).to_bytes(2, "little") + (text + " " * padding + "\n").encode()
+
+
+class ExplorationWriter:
+    """
+    Écriture en flux d'une séquence d'exploration [(ordre, (x, y)), ...] :
+    binaire compact, .npy (int32, forme (n, 3)) ou CSV "ordre,x,y". Les étapes
+    sont converties par blocs de chunk_size (octets packés par struct puis un
+    seul join, ou un seul formatage du bloc pour le CSV) et la mémoire utilisée
+    ne dépend pas de la longueur de la trace.
+    """
+
+    def __init__(self, path, fmt=None, chunk_size=CHUNK_SIZE):
+        self.fmt = _format_of(path, fmt)
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._pending = []
+        self.file = open(path, "wb")
+        if self.fmt == "bin":
+            self.file.write(BINARY_MAGIC)
+        elif self.fmt == "npy":
+            self.file.write(_npy_header(0))
+        else:
+            self.file.write(b"order,x,y\n")
+
+    def append(self, order, cell):
+        self._pending.append((order, cell))
+        if len(self._pending) >= self.chunk_size:
+            self._write_chunk(self._pending)
+            self._pending = []
+
+    def extend(self, steps):
+        """
+        Écrit toutes les étapes d'un itérable (liste exploration_order ou générateur).
+        """
+        if self._pending:
+            self._write_chunk(self._pending)
+            self._pending = []
+        steps = iter(steps)
+        while True:
+            chunk = list(islice(steps, self.chunk_size))
+            if not chunk:
+                break
+            self._write_chunk(chunk)
+
+    def _write_chunk(self, chunk):
+        self.count += len(chunk)
+        if self.fmt == "csv":
+            values = tuple([v for order, (x, y) in chunk for v in (order, x, y)])
+            self.file.write(("%d,%d,%d\n" * len(chunk) % values).encode())
+            return
+        pack = _STEP.pack
+        self.file.write(b"".join([pack(order, x, y) for order, (x, y) in chunk]))
+
+    def close(self):
+        if self.file.closed:
+            return
+        if self._pending:
+            self._write_chunk(self._pending)
+            self._pending = []
+        if self.fmt == "npy":
+            self.file.seek(0)
+            self.file.write(_npy_header(self.count))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_exploration(path, steps, fmt=None, chunk_size=CHUNK_SIZE):
+    """
+    Exporte une séquence d'exploration dans path ; le format vient de fmt ou de
+    l'extension (.bin, .npy, .csv). Retourne le nombre d'étapes écrites.
+    """
+    with ExplorationWriter(path, fmt, chunk_size) as writer:
+        writer.extend(steps)
+    return writer.count
+
+
+def read_exploration(path, fmt=None, chunk_size=CHUNK_SIZE):
+    """
+    Relit un export par blocs et produit les étapes (ordre, (x, y)).
+    """
+    fmt = _format_of(path, fmt)
+    with open(path, "rb") as f:
+        if fmt == "csv":
+            f.readline()
+            for line in f:
+                order, x, y = map(int, line.split(b","))
+                yield order, (x, y)
+            return
+        if fmt == "bin":
+            if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+                raise ValueError(f"{path} n'est pas un export binaire d'exploration")
+        else:
+            f.seek(8)
+            f.seek(10 + int.from_bytes(f.read(2), "little"))
+        while True:
+            data = f.read(12 * chunk_size)
+            if not data:
+                break
+            values = array('i')
+            values.frombytes(data)
+            if sys.byteorder == "big":
+                values.byteswap()
+            for k in range(0, len(values), 3):
+                yield values[k], (values[k + 1], values[k + 2])
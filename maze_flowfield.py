@@ -0,0 +1,76 @@
+from maze7 import MOVES
+from maze_multigoal import nearest_goal_field
+
+NO_MOVE = 0xFF
+
+
+class FlowField:
+    """
+    Champ de directions vers une ou plusieurs arrivées, calculé par une seule BFS
+    inverse. Chaque agent avance ensuite en O(1) par pas.
+    """
+
+    def __init__(self, maze, goals):
+        self.width = width = len(maze.grid[0])
+        self.goals = frozenset(goals)
+        self.revision = maze.revision
+        self.distances, _, parents = nearest_goal_field(maze, self.goals)
+        offsets = {1: 0, width: 1, -1: 2, -width: 3}
+        # Un octet par cellule : indice dans MOVES du pas vers l'arrivée la plus proche
+        self.directions = bytearray([NO_MOVE]) * len(parents)
+        for i, parent in enumerate(parents):
+            if parent >= 0:
+                self.directions[i] = offsets[parent - i]
+
+    def distance(self, cell):
+        """
+        Nombre de pas restants jusqu'à l'arrivée, None si elle est inaccessible.
+        """
+        distance = self.distances[cell[0] * self.width + cell[1]]
+        return None if distance < 0 else distance
+
+    def next_step(self, cell):
+        """
+        Position suivante vers l'arrivée, None si cell est une arrivée ou ne peut pas l'atteindre.
+        """
+        direction = self.directions[cell[0] * self.width + cell[1]]
+        if direction == NO_MOVE:
+            return None
+        dx, dy = MOVES[direction]
+        return (cell[0] + dx, cell[1] + dy)
+
+    def advance(self, positions):
+        """
+        Fait avancer tous les agents d'un pas ; ceux qui sont arrivés ou bloqués restent sur place.
+        """
+        return [self.next_step(cell) or cell for cell in positions]
+
+
+class FlowFieldCache:
+    """
+    Cache des champs de directions d'un labyrinthe, par ensemble d'arrivées.
+    Le cache est vidé dès que maze.revision change (voir Maze.set_wall).
+    """
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.fields = {}
+        self.revision = maze.revision
+
+    def get(self, goal=None):
+        """
+        Retourne le champ vers goal (une position ou un ensemble), maze.goals par défaut.
+        """
+        if self.maze.revision != self.revision:
+            self.fields.clear()
+            self.revision = self.maze.revision
+        if goal is None:
+            goals = self.maze.goals
+        elif isinstance(goal, tuple) and all(isinstance(v, int) for v in goal):
+            goals = frozenset([goal])
+        else:
+            goals = frozenset(goal)
+        field = self.fields.get(goals)
+        if field is None:
+            field = self.fields[goals] = FlowField(self.maze, goals)
+        return field
@@ -0,0 +1,427 @@
+"""
+Banc de comparaison des solveurs : chaque variante de Player (maze.py à maze8.py)
+et chaque moteur ajouté depuis est exécuté sur les mêmes labyrinthes tirés par
+graine. On vérifie que tous s'accordent sur l'accessibilité de l'arrivée, que
+les chemins rendus sont valides, qu'ils sont les plus courts pour les solveurs
+optimaux, que les solveurs d'une même famille explorent le même nombre de cases,
+et que les labyrinthes parfaits le sont (aucune boucle).
+
+Les variantes historiques travaillent sur des grilles d'entiers (1 = mur) et
+affichent la grille à chaque pas ; les adaptateurs convertissent la grille et
+neutralisent display, qui n'est pas mesuré (celui de maze.py lit d'ailleurs un
+attribut visited que Maze n'a pas).
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import sys
+import threading
+from collections import deque, namedtuple
+
+from maze7 import WALL_CHARS, MazeGenerator
+from maze8 import MazeGenerator as RandomGoalGenerator
+from maze_algorithms import ALGORITHMS
+from maze_connectivity import open_cheapest_walls
+from maze_random import BlockRandom, wall_mask
+
+# family : solveurs censés explorer exactement le même nombre de cases (moves)
+Solver = namedtuple("Solver", "name run optimal family")
+# found : arrivée atteinte ; path : chemin rendu (None si le solveur n'en construit pas) ;
+# moves : longueur de l'ordre d'exploration (None si le solveur n'en garde pas)
+Outcome = namedtuple("Outcome", "found path moves")
+# perfect : labyrinthe généré censé être un arbre (un seul chemin entre deux cases)
+Case = namedtuple("Case", "name grid start goal perfect", defaults=(False,))
+
+SOLVERS = {}
+
+# Les variantes récursives descendent d'un niveau par case du chemin courant
+STACK_SIZE = 512 * 1024 * 1024
+RECURSION_LIMIT = 1_000_000
+
+
+def register(name, optimal, family=None):
+    def decorator(func):
+        SOLVERS[name] = Solver(name, func, optimal, family)
+        return func
+    return decorator
+
+
+def _quiet(position):
+    pass
+
+
+def _legacy_maze(module_name, grid, start, goal):
+    # Grille d'entiers des scripts maze.py à maze6.py : 1 = mur, 0 = passage
+    module = importlib.import_module(module_name)
+    maze = module.Maze([[1 if c == '#' else 0 for c in row] for row in grid], start, goal)
+    maze.display = _quiet
+    return module, maze
+
+
+def _current_maze(grid, start, goal):
+    from maze7 import Maze
+    maze = Maze([row[:] for row in grid], start, goal)
+    maze.display = _quiet
+    return maze
+
+
+def _path_from_parents(parents, goal):
+    if goal not in parents:
+        return None
+    path = []
+    current = goal
+    while current is not None:
+        path.append(current)
+        current = parents[current]
+    path.reverse()
+    return path
+
+
+@register("maze.dfs", optimal=False)
+def _run_maze1(grid, start, goal):
+    module, maze = _legacy_maze("maze", grid, start, goal)
+    player = module.Player(maze)
+    found = player.dfs(start)
+    return Outcome(found, player.path[::-1] if found else None, None)
+
+
+@register("maze2.dfs", optimal=False)
+def _run_maze2(grid, start, goal):
+    module, maze = _legacy_maze("maze2", grid, start, goal)
+    player = module.Player(maze)
+    found = player.dfs(start)
+    return Outcome(found, list(player.path) if found else None, None)
+
+
+@register("maze3.dfs", optimal=False)
+def _run_maze3(grid, start, goal):
+    module, maze = _legacy_maze("maze3", grid, start, goal)
+    player = module.Player(maze)
+    found = player.dfs(start)
+    return Outcome(found, list(player.path) if found else None, len(player.exploration_order))
+
+
+@register("maze4.dfs", optimal=False, family="dfs")
+def _run_maze4(grid, start, goal):
+    module, maze = _legacy_maze("maze4", grid, start, goal)
+    player = module.Player(maze)
+    found = player.dfs(start)
+    return Outcome(found, player.path + [goal] if found else None, len(player.exploration_order))
+
+
+@register("maze5.bfs", optimal=True, family="bfs")
+def _run_maze5(grid, start, goal):
+    module, maze = _legacy_maze("maze5", grid, start, goal)
+    player = module.Player(maze)
+    return Outcome(player.bfs(), None, len(player.exploration_order))
+
+
+@register("maze6.bfs", optimal=True, family="bfs")
+def _run_maze6(grid, start, goal):
+    module, maze = _legacy_maze("maze6", grid, start, goal)
+    player = module.Player(maze)
+    found = player.bfs()
+    return Outcome(found, _path_from_parents(player.parents, goal) if found else None,
+                   len(player.exploration_order))
+
+
+@register("maze7.bfs", optimal=True, family="bfs")
+def _run_maze7(grid, start, goal):
+    from maze7 import Player
+    player = Player(_current_maze(grid, start, goal))
+    found = player.bfs()
+    return Outcome(found, _path_from_parents(player.parents, goal) if found else None,
+                   len(player.exploration_order))
+
+
+@register("maze8.dfs", optimal=False, family="dfs")
+def _run_maze8(grid, start, goal):
+    from maze8 import Player
+    player = Player(_current_maze(grid, start, goal))
+    found = player.dfs(start)
+    return Outcome(found, player.path + [goal] if found else None, len(player.exploration_order))
+
+
+@register("stepwise.bfs", optimal=True, family="bfs")
+def _run_stepwise_bfs(grid, start, goal):
+    from maze_stepwise import StepwiseBFS
+    search = StepwiseBFS(_current_maze(grid, start, goal))
+    search.run()
+    return Outcome(search.status == "found", search.path(), search.moves)
+
+
+@register("stepwise.dfs", optimal=False, family="dfs")
+def _run_stepwise_dfs(grid, start, goal):
+    from maze_stepwise import StepwiseDFS
+    search = StepwiseDFS(_current_maze(grid, start, goal))
+    search.run()
+    return Outcome(search.status == "found", search.path(), search.moves)
+
+
+@register("kernel.bfs", optimal=True, family="bfs")
+def _run_kernel_bfs(grid, start, goal):
+    from maze_kernels import solve_bfs
+    path, moves = solve_bfs(_current_maze(grid, start, goal))
+    return Outcome(path is not None, path, moves)
+
+
+@register("kernel.dfs", optimal=False, family="dfs")
+def _run_kernel_dfs(grid, start, goal):
+    from maze_kernels import solve_dfs
+    path, moves = solve_dfs(_current_maze(grid, start, goal))
+    return Outcome(path is not None, path, moves)
+
+
+@register("jps", optimal=True)
+def _run_jps(grid, start, goal):
+    from maze_jps import JumpPointPlayer
+    player = JumpPointPlayer(_current_maze(grid, start, goal))
+    found = player.jps()
+    return Outcome(found, _path_from_parents(player.parents, goal) if found else None, None)
+
+
+@register("dial", optimal=True)
+def _run_dial(grid, start, goal):
+    from maze_weighted import DialPlayer
+    player = DialPlayer(_current_maze(grid, start, goal))
+    found = player.dijkstra()
+    return Outcome(found, _path_from_parents(player.parents, goal) if found else None, None)
+
+
+@register("lpa", optimal=True)
+def _run_lpa(grid, start, goal):
+    from maze_dynamic import IncrementalPlanner
+    path = IncrementalPlanner(_current_maze(grid, start, goal)).current_path()
+    return Outcome(path is not None, path, None)
+
+
+@register("flowfield", optimal=True)
+def _run_flowfield(grid, start, goal):
+    from maze_flowfield import FlowField
+    field = FlowField(_current_maze(grid, start, goal), [goal])
+    if field.distance(start) is None:
+        return Outcome(False, None, None)
+    path = [start]
+    while path[-1] != goal:
+        path.append(field.next_step(path[-1]))
+    return Outcome(True, path, None)
+
+
+@register("multigoal", optimal=True)
+def _run_multigoal(grid, start, goal):
+    from maze_multigoal import nearest_exits
+    result = nearest_exits(_current_maze(grid, start, goal))[start]
+    return Outcome(result is not None, None if result is None else result[2], None)
+
+
+@register("hpa", optimal=False)
+def _run_hpa(grid, start, goal):
+    from maze_hpa import HierarchicalPlanner
+    # Petits blocs : les labyrinthes du corpus en comptent alors plusieurs par côté
+    path = HierarchicalPlanner(_current_maze(grid, start, goal), cluster_size=8).find_path()
+    return Outcome(path is not None, path, None)
+
+
+@register("allpairs", optimal=True)
+def _run_allpairs(grid, start, goal):
+    from maze_allpairs import DistanceTable
+    try:
+        table = DistanceTable(_current_maze(grid, start, goal), memory_budget=8 * 1024 * 1024)
+    except ValueError:
+        return None  # table trop grande pour ce labyrinthe : solveur ignoré
+    path = table.path(start, goal)
+    return Outcome(path is not None, path, None)
+
+
+def run_solver(solver, case):
+    """
+    Exécute un solveur sur une copie du cas, sortie standard neutralisée, dans un
+    thread à grande pile pour les variantes récursives. Retourne un Outcome, ou
+    None si le solveur ne s'applique pas à ce cas.
+    """
+    result = {}
+
+    def target():
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                result["outcome"] = solver.run([row[:] for row in case.grid], case.start, case.goal)
+        except BaseException as error:
+            result["error"] = error
+
+    limit = sys.getrecursionlimit()
+    previous = threading.stack_size(STACK_SIZE)
+    sys.setrecursionlimit(RECURSION_LIMIT)
+    try:
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    finally:
+        threading.stack_size(previous)
+        sys.setrecursionlimit(limit)
+    if "error" in result:
+        raise result["error"]
+    return result["outcome"]
+
+
+def reference_distance(case):
+    """
+    Distance BFS de référence, calculée ici sur la grille sans passer par un
+    solveur testé. None si l'arrivée est inaccessible.
+    """
+    height, width = len(case.grid), len(case.grid[0])
+    distances = {case.start: 0}
+    queue = deque([case.start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == case.goal:
+            return distances[(x, y)]
+        for nx, ny in ((x, y + 1), (x + 1, y), (x, y - 1), (x - 1, y)):
+            if (0 <= nx < height and 0 <= ny < width and case.grid[nx][ny] != '#'
+                    and (nx, ny) not in distances):
+                distances[(nx, ny)] = distances[(x, y)] + 1
+                queue.append((nx, ny))
+    return None
+
+
+def path_errors(case, path):
+    """
+    Liste des défauts d'un chemin : extrémités, pas non adjacents, murs traversés.
+    """
+    errors = []
+    if path[0] != case.start or path[-1] != case.goal:
+        errors.append(f"extrémités {path[0]} -> {path[-1]}")
+    height, width = len(case.grid), len(case.grid[0])
+    for (x, y), (nx, ny) in zip(path, path[1:]):
+        if abs(x - nx) + abs(y - ny) != 1:
+            errors.append(f"saut de {(x, y)} à {(nx, ny)}")
+            break
+    for x, y in path:
+        if not (0 <= x < height and 0 <= y < width) or case.grid[x][y] == '#':
+            errors.append(f"case {(x, y)} hors du labyrinthe ou dans un mur")
+            break
+    return errors
+
+
+def extra_edges(grid):
+    """
+    Passages en trop par rapport à un arbre couvrant les cases ouvertes (arêtes
+    - cases + 1) : 0 pour un labyrinthe parfait et connexe, sinon le nombre de boucles.
+    """
+    height, width = len(grid), len(grid[0])
+    cells = edges = 0
+    for x in range(height):
+        for y in range(width):
+            if grid[x][y] != '#':
+                cells += 1
+                edges += (y + 1 < width and grid[x][y + 1] != '#') + (x + 1 < height and grid[x + 1][y] != '#')
+    return edges - cells + 1
+
+
+def _grid_from_mask(mask, width, height, start, goal):
+    cells = mask.translate(WALL_CHARS)
+    grid = [list(cells[x * width:(x + 1) * width].decode()) for x in range(height)]
+    grid[start[0]][start[1]] = 'S'
+    grid[goal[0]][goal[1]] = 'G'
+    return grid
+
+
+def corpus(seeds, width, height):
+    """
+    Labyrinthes de test : pour chaque graine, un labyrinthe de chaque algorithme
+    (parfaits, un seul chemin), un labyrinthe à arrivée tirée au hasard (maze8),
+    des murs aléatoires réparés (boucles, plusieurs chemins de longueurs
+    différentes), une grille presque vide et des murs aléatoires non réparés
+    (arrivée parfois inaccessible).
+    """
+    start, goal = (0, 0), (height - 1, width - 1)
+    size = width * height
+    keep = (0, size - 1)
+    for seed in seeds:
+        for algorithm in ["prim"] + sorted(ALGORITHMS):
+            generator = MazeGenerator(width, height, seed, algorithm=algorithm)
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator.generate_maze()
+            yield Case(f"{algorithm}-{seed}", generator.grid, generator.start, generator.goal, True)
+        # L'arrivée peut tomber sur un passage ou un pilier du treillis (voir connect_to_lattice)
+        algorithms = ["prim"] + sorted(ALGORITHMS)
+        algorithm = algorithms[seed % len(algorithms)]
+        generator = RandomGoalGenerator(width, height, seed, algorithm=algorithm)
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.generate_maze()
+        yield Case(f"goal-{algorithm}-{seed}", generator.grid, generator.start, generator.goal, True)
+        rng = BlockRandom(seed)
+        grid = _grid_from_mask(wall_mask(rng, size, int(size * 0.3), keep), width, height, start, goal)
+        open_cheapest_walls(grid, start, goal)
+        yield Case(f"loops-{seed}", grid, start, goal)
+        grid = _grid_from_mask(wall_mask(rng, size, int(size * 0.05), keep), width, height, start, goal)
+        yield Case(f"open-{seed}", grid, start, goal)
+        grid = _grid_from_mask(wall_mask(rng, size, int(size * 0.45), keep), width, height, start, goal)
+        yield Case(f"blocked-{seed}", grid, start, goal)
+
+
+def check(cases, solvers=None):
+    """
+    Exécute chaque solveur sur chaque cas et retourne (résumé par solveur, défauts).
+    """
+    solvers = [SOLVERS[name] for name in (solvers or SOLVERS)]
+    summary = {solver.name: {"cases": 0, "found": 0, "optimal": 0, "skipped": 0} for solver in solvers}
+    failures = []
+    for case in cases:
+        if case.perfect and extra_edges(case.grid):
+            failures.append((case.name, "générateur", f"{extra_edges(case.grid)} boucle(s) dans un labyrinthe parfait"))
+        expected = reference_distance(case)
+        family_moves = {}
+        for solver in solvers:
+            outcome = run_solver(solver, case)
+            counts = summary[solver.name]
+            if outcome is None:
+                counts["skipped"] += 1
+                continue
+            counts["cases"] += 1
+            if outcome.found != (expected is not None):
+                failures.append((case.name, solver.name, f"found={outcome.found}, référence {expected}"))
+                continue
+            if not outcome.found:
+                continue
+            counts["found"] += 1
+            if outcome.path is not None:
+                for error in path_errors(case, outcome.path):
+                    failures.append((case.name, solver.name, error))
+                if len(outcome.path) - 1 == expected:
+                    counts["optimal"] += 1
+                elif solver.optimal:
+                    failures.append((case.name, solver.name,
+                                     f"chemin de {len(outcome.path) - 1} pas, optimum {expected}"))
+            if solver.family is not None and outcome.moves is not None:
+                family_moves.setdefault(solver.family, {})[solver.name] = outcome.moves
+        for family, moves in family_moves.items():
+            if len(set(moves.values())) > 1:
+                failures.append((case.name, family, f"explorations différentes {moves}"))
+    return summary, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare tous les solveurs sur les mêmes labyrinthes.")
+    parser.add_argument("--width", type=int, default=31)
+    parser.add_argument("--height", type=int, default=25)
+    parser.add_argument("--seeds", type=int, default=3, help="nombre de graines (0, 1, ...)")
+    parser.add_argument("--solver", action="append", choices=sorted(SOLVERS),
+                        help="limite la comparaison à ces solveurs (option répétable)")
+    args = parser.parse_args(argv)
+
+    cases = list(corpus(range(args.seeds), args.width, args.height))
+    summary, failures = check(cases, args.solver)
+    print(f"{len(cases)} labyrinthes {args.width}x{args.height}")
+    print(f"{'solveur':<14} {'cas':>5} {'trouvés':>8} {'optimaux':>9} {'ignorés':>8}")
+    for name, counts in summary.items():
+        print(f"{name:<14} {counts['cases']:>5} {counts['found']:>8} {counts['optimal']:>9} {counts['skipped']:>8}")
+    for case, solver, message in failures:
+        print(f"ÉCHEC {case} {solver} : {message}")
+    if failures:
+        sys.exit(1)
+    print("Tous les solveurs concordent.")
+
+
+if __name__ == "__main__":
+    main()
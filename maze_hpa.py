@@ -0,0 +1,250 @@
+import heapq
+
+from maze7 import MOVES
+
+# Un passage plus court entre deux blocs n'a qu'une entrée (au milieu), un plus long une à chaque bout
+LONG_ENTRANCE = 6
+
+
+class HierarchicalPlanner:
+    """
+    Recherche hiérarchique (HPA*) pour les très grands labyrinthes. La grille est
+    découpée en blocs de cluster_size x cluster_size cellules ; chaque passage
+    entre deux blocs voisins donne une ou deux entrées (paires de cellules
+    ouvertes de part et d'autre de la frontière). Les distances entre entrées
+    d'un même bloc sont précalculées. Une requête relie le départ et l'arrivée
+    aux entrées de leur bloc, cherche dans ce graphe abstrait (A*) puis raffine
+    chaque arête par une recherche limitée à un bloc. Les chemins sont valides
+    mais pas toujours les plus courts : ils passent par les entrées.
+    Après set_wall / clear_wall, seuls le bloc modifié et, si la cellule est sur
+    une frontière, le bloc voisin sont recalculés. Une requête vise une seule
+    arrivée (maze.goal par défaut, refusé si le labyrinthe en a plusieurs).
+    """
+
+    def __init__(self, maze, cluster_size=16):
+        self.maze = maze
+        self.cluster_size = cluster_size
+        self.height, self.width = len(maze.grid), len(maze.grid[0])
+        self.rows = -(-self.height // cluster_size)
+        self.columns = -(-self.width // cluster_size)
+        self.borders = {}  # (bloc, bloc à droite ou en dessous) -> [(cellule, cellule voisine)]
+        self.links = {}  # entrée -> {entrée du bloc voisin: coût pour y entrer}
+        self.intra = {}  # bloc -> {entrée: {autre entrée du bloc: distance dans le bloc}}
+        self.expansions = 0  # sommets abstraits développés par la dernière requête
+        clusters = [(cx, cy) for cx in range(self.rows) for cy in range(self.columns)]
+        for cx, cy in clusters:
+            if cy + 1 < self.columns:
+                self._build_border((cx, cy), (cx, cy + 1))
+            if cx + 1 < self.rows:
+                self._build_border((cx, cy), (cx + 1, cy))
+        for cluster in clusters:
+            self._build_intra(cluster)
+
+    def cluster_of(self, cell):
+        return (cell[0] // self.cluster_size, cell[1] // self.cluster_size)
+
+    def _bounds(self, cluster):
+        x0, y0 = cluster[0] * self.cluster_size, cluster[1] * self.cluster_size
+        return x0, min(x0 + self.cluster_size, self.height), y0, min(y0 + self.cluster_size, self.width)
+
+    def _build_border(self, first, second):
+        """
+        Recalcule les entrées entre first et le bloc second situé à sa droite ou
+        en dessous. Retourne True si elles ont changé.
+        """
+        x0, x1, y0, y1 = self._bounds(first)
+        if second[1] > first[1]:
+            pairs = [((x, y1 - 1), (x, y1)) for x in range(x0, x1)]
+        else:
+            pairs = [((x1 - 1, y), (x1, y)) for y in range(y0, y1)]
+        maze = self.maze
+        entrances = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and not maze.is_wall(*a) and not maze.is_wall(*b):
+                run.append((a, b))
+                continue
+            if len(run) >= LONG_ENTRANCE:
+                entrances += [run[0], run[-1]]
+            elif run:
+                entrances.append(run[len(run) // 2])
+            run = []
+        previous = self.borders.get((first, second), [])
+        if entrances == previous:
+            return False
+        for a, b in previous:
+            self._unlink(a, b)
+            self._unlink(b, a)
+        for a, b in entrances:
+            self.links.setdefault(a, {})[b] = maze.cost(*b)
+            self.links.setdefault(b, {})[a] = maze.cost(*a)
+        if entrances:
+            self.borders[(first, second)] = entrances
+        else:
+            del self.borders[(first, second)]
+        return True
+
+    def _unlink(self, a, b):
+        targets = self.links[a]
+        del targets[b]
+        if not targets:
+            del self.links[a]
+
+    def _entrances(self, cluster):
+        cx, cy = cluster
+        nodes = set()
+        for other in ((cx, cy + 1), (cx + 1, cy)):
+            nodes.update(a for a, _ in self.borders.get((cluster, other), ()))
+        for other in ((cx, cy - 1), (cx - 1, cy)):
+            nodes.update(b for _, b in self.borders.get((other, cluster), ()))
+        return nodes
+
+    def _build_intra(self, cluster):
+        nodes = self._entrances(cluster)
+        edges = {}
+        for node in nodes:
+            distances, _ = self._local_search(cluster, node)
+            edges[node] = {other: distances[other] for other in nodes if other != node and other in distances}
+        self.intra[cluster] = edges
+
+    def _local_search(self, cluster, source, target=None):
+        """
+        Dijkstra depuis source sans sortir du bloc (coût d'une cellule : celui d'y
+        entrer). S'arrête dès que target est atteinte. Retourne (distances, parents).
+        """
+        maze = self.maze
+        x0, x1, y0, y1 = self._bounds(cluster)
+        distances = {source: 0}
+        parents = {source: None}
+        queue = [(0, source)]
+        done = set()
+        while queue:
+            distance, cell = heapq.heappop(queue)
+            if cell in done:
+                continue
+            done.add(cell)
+            if cell == target:
+                break
+            x, y = cell
+            for dx, dy in MOVES:
+                nx, ny = x + dx, y + dy
+                if x0 <= nx < x1 and y0 <= ny < y1 and not maze.is_wall(nx, ny):
+                    candidate = distance + maze.cost(nx, ny)
+                    if candidate < distances.get((nx, ny), candidate + 1):
+                        distances[(nx, ny)] = candidate
+                        parents[(nx, ny)] = cell
+                        heapq.heappush(queue, (candidate, (nx, ny)))
+        return distances, parents
+
+    def update(self, x, y):
+        """
+        Met à jour les entrées et les distances après un changement du mur (x, y)
+        fait directement sur le labyrinthe (set_wall et clear_wall l'appellent).
+        """
+        cluster = self.cluster_of((x, y))
+        cx, cy = cluster
+        x0, x1, y0, y1 = self._bounds(cluster)
+        touched = [cluster]
+        # Seules les frontières sur lesquelles se trouve la cellule peuvent changer
+        for on_border, first, second in ((y == y1 - 1, cluster, (cx, cy + 1)), (x == x1 - 1, cluster, (cx + 1, cy)),
+                                         (y == y0, (cx, cy - 1), cluster), (x == x0, (cx - 1, cy), cluster)):
+            other = second if first == cluster else first
+            if on_border and 0 <= other[0] < self.rows and 0 <= other[1] < self.columns:
+                if self._build_border(first, second):
+                    touched.append(other)
+        for cluster in touched:
+            self._build_intra(cluster)
+
+    def set_wall(self, x, y):
+        self.maze.set_wall(x, y, True)
+        self.update(x, y)
+
+    def clear_wall(self, x, y):
+        self.maze.set_wall(x, y, False)
+        self.update(x, y)
+
+    def _heuristic(self, cell, goal):
+        return abs(cell[0] - goal[0]) + abs(cell[1] - goal[1])  # admissible : chaque pas coûte au moins 1
+
+    def abstract_path(self, start=None, goal=None):
+        """
+        Suite de sommets du graphe abstrait (départ, entrées traversées, arrivée)
+        et son coût, ou (None, None) si l'arrivée est inaccessible.
+        """
+        maze = self.maze
+        start = maze.start if start is None else start
+        if goal is None:
+            if len(maze.goals) > 1:
+                raise ValueError(f"Plusieurs arrivées ({len(maze.goals)}) : préciser goal")
+            goal = maze.goal
+        self.expansions = 0
+        if maze.is_wall(*start) or maze.is_wall(*goal):
+            return None, None
+        if start == goal:
+            return [start], 0
+        start_cluster, goal_cluster = self.cluster_of(start), self.cluster_of(goal)
+        # Arêtes temporaires : départ -> entrées de son bloc, entrées du bloc d'arrivée -> arrivée
+        distances, _ = self._local_search(start_cluster, start)
+        nodes = self.intra[start_cluster]
+        start_edges = {node: distances[node] for node in nodes if node != start and node in distances}
+        if start_cluster == goal_cluster and goal in distances:
+            start_edges[goal] = distances[goal]
+        # Distances depuis l'arrivée, ramenées au sens entrée -> arrivée (on paie l'arrivée, pas l'entrée)
+        distances, _ = self._local_search(goal_cluster, goal)
+        goal_cost = maze.cost(*goal)
+        goal_edges = {node: distances[node] + goal_cost - maze.cost(*node)
+                      for node in self.intra[goal_cluster] if node in distances}
+
+        best = {start: 0}
+        parents = {start: None}
+        queue = [(self._heuristic(start, goal), 0, start)]
+        closed = set()
+        while queue:
+            _, distance, node = heapq.heappop(queue)
+            if node in closed:
+                continue
+            closed.add(node)
+            self.expansions += 1
+            if node == goal:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parents[node]
+                path.reverse()
+                return path, distance
+            edges = [start_edges.items() if node == start
+                     else self.intra[self.cluster_of(node)].get(node, {}).items(),
+                     self.links.get(node, {}).items()]
+            if node in goal_edges:
+                edges.append([(goal, goal_edges[node])])
+            for targets in edges:
+                for other, cost in targets:
+                    candidate = distance + cost
+                    if candidate < best.get(other, candidate + 1):
+                        best[other] = candidate
+                        parents[other] = node
+                        heapq.heappush(queue, (candidate + self._heuristic(other, goal), candidate, other))
+        return None, None
+
+    def find_path(self, start=None, goal=None):
+        """
+        Chemin de cellules du départ à l'arrivée (maze.start et maze.goal par
+        défaut), None si l'arrivée est inaccessible.
+        """
+        nodes, _ = self.abstract_path(start, goal)
+        if nodes is None:
+            return None
+        path = [nodes[0]]
+        for node, following in zip(nodes, nodes[1:]):
+            cluster = self.cluster_of(node)
+            if self.cluster_of(following) != cluster:
+                path.append(following)  # arête entre deux blocs : cellules voisines
+                continue
+            _, parents = self._local_search(cluster, node, following)
+            segment = []
+            cell = following
+            while cell != node:
+                segment.append(cell)
+                cell = parents[cell]
+            path.extend(reversed(segment))
+        return path
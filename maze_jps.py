@@ -0,0 +1,168 @@
+import heapq
+
+from maze7 import Player
+
+
+class JumpPointPlayer(Player):
+    """
+    Jump Point Search sur la grille 4-connexe définie par Player.moves.
+    Seuls les points de saut sont développés ; les cellules intermédiaires
+    sont reconstituées pour compute_shortest_path. Avec plusieurs sorties,
+    l'heuristique est la distance de Manhattan à la plus proche.
+    """
+
+    def _heuristic(self, x, y):
+        return min(abs(x - gx) + abs(y - gy) for gx, gy in self.maze.goals)
+
+    def _walkable(self, x, y):
+        # is_wall vaut aussi pour la bordure de Maze.walls : un saut ne sort jamais de plus d'une case
+        return not self.maze.is_wall(x, y)
+
+    def _jump_horizontal(self, x, y, dy):
+        """
+        Avance horizontalement jusqu'au prochain point de saut (ou None). Le
+        résultat est retenu pour chaque cellule parcourue : un saut vertical qui
+        recroise la ligne plus tard le relit au lieu de la rebalayer.
+        """
+        maze = self.maze
+        walls, stride = maze.walls, maze.stride
+        above, row, below = x * stride + 1, (x + 1) * stride + 1, (x + 2) * stride + 1
+        known = self._jump_tables.get((x, dy))
+        if known is None:
+            known = self._jump_tables[(x, dy)] = {}
+        passed = []
+        while True:
+            if walls[row + y]:
+                jump = None
+                break
+            if y in known:
+                jump = known[y]
+                break
+            if (maze.is_goal(x, y) or (not walls[above + y] and walls[above + y - dy])
+                    or (not walls[below + y] and walls[below + y - dy])):
+                jump = (x, y)
+                known[y] = jump
+                break
+            passed.append(y)
+            y += dy
+        for y in passed:
+            known[y] = jump
+        return jump
+
+    def _jump(self, x, y, dx, dy):
+        """
+        Avance dans la direction (dx, dy) jusqu'au prochain point de saut (ou None).
+        En vertical, une cellule est aussi un point de saut si un saut horizontal en part.
+        """
+        if dy != 0:
+            return self._jump_horizontal(x, y, dy)
+        walkable = self._walkable
+        while walkable(x, y):
+            if self.maze.is_goal(x, y):
+                return (x, y)
+            if (walkable(x, y - 1) and not walkable(x - dx, y - 1)) or (walkable(x, y + 1) and not walkable(x - dx, y + 1)):
+                return (x, y)
+            if self._jump_horizontal(x, y + 1, 1) is not None or self._jump_horizontal(x, y - 1, -1) is not None:
+                return (x, y)
+            x += dx
+        return None
+
+    def _successor_directions(self, node, parent):
+        if parent is None:
+            return self.moves
+        x, y = node
+        dx = (x > parent[0]) - (x < parent[0])
+        dy = (y > parent[1]) - (y < parent[1])
+        if dy != 0:
+            return [(-1, 0), (1, 0), (0, dy)]
+        return [(0, -1), (0, 1), (dx, 0)]
+
+    def jps(self):
+        stats = self.stats
+        if stats is not None:
+            stats.start("search")
+        start = self.maze.start
+        self._jump_tables = {}  # (ligne, sens) -> {colonne: point de saut atteint en avançant}
+        g = {start: 0}
+        jump_parents = {start: None}
+        heap = [(self._heuristic(*start), 0, start)]
+        self.order += 1
+        self.exploration_order.append((self.order, start))
+
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if cost > g[node]:
+                continue
+            if stats is not None:
+                stats.expansions += 1
+            x, y = node
+            if self.maze.is_goal(x, y):
+                if stats is not None:
+                    stats.stop("search")
+                print(f"Arrivée trouvée à {node}")
+                self.display_exploration_order()
+                self.total_length_exploration()
+                self._expand_segments(jump_parents, node)
+                self.compute_shortest_path(node)
+                if stats is not None:
+                    stats.emit()
+                return True
+
+            for dx, dy in self._successor_directions(node, jump_parents[node]):
+                if stats is not None:
+                    stats.neighbour_checks += 1
+                if not self._walkable(x + dx, y + dy):
+                    continue
+                jump_point = self._jump(x + dx, y + dy, dx, dy)
+                if jump_point is None:
+                    continue
+                new_cost = cost + abs(jump_point[0] - x) + abs(jump_point[1] - y)
+                if jump_point in g and g[jump_point] <= new_cost:
+                    if stats is not None:
+                        stats.revisits += 1
+                    continue
+                g[jump_point] = new_cost
+                jump_parents[jump_point] = node
+                self.visited.add(jump_point)
+                jx, jy = jump_point
+                heapq.heappush(heap, (new_cost + self._heuristic(jx, jy), new_cost, jump_point))
+                self.maze.grid[jx][jy] = 'x'
+                if stats is None:
+                    self.maze.display(jump_point)
+                else:
+                    stats.frontier(len(heap))
+                    stats.start("render")
+                    self.maze.display(jump_point)
+                    stats.stop("render")
+                self.order += 1
+                self.exploration_order.append((self.order, jump_point))
+
+        if stats is not None:
+            stats.stop("search")
+        print("Pas de chemin vers la sortie.")
+        self.display_exploration_order()
+        self.total_length_exploration()
+        if stats is not None:
+            stats.emit()
+        return False
+
+    def _expand_segments(self, jump_parents, goal):
+        """
+        Remplit self.parents cellule par cellule entre les points de saut du chemin trouvé.
+        """
+        self.parents = {self.maze.start: None}
+        node = goal
+        while jump_parents[node] is not None:
+            parent = jump_parents[node]
+            dx = (parent[0] > node[0]) - (parent[0] < node[0])
+            dy = (parent[1] > node[1]) - (parent[1] < node[1])
+            current = node
+            while current != parent:
+                step = (current[0] + dx, current[1] + dy)
+                self.parents[current] = step
+                current = step
+            node = parent
+
+    def find_exit(self):
+        if not self.jps():
+            print("Pas de chemin vers la sortie.")
@@ -0,0 +1,225 @@
+"""
+Boucles chaudes de la génération et de la résolution écrites sur la grille
+compacte entourée d'une bordure d'une case (un octet par cellule, indice
+(x + 1) * stride + y + 1 avec stride = largeur + 2 : les voisins sont à ±1 et
+±stride, sans test de bornes), sans objets Python :
+compilées par Numba quand il est installé, exécutées telles quelles sinon. Les
+deux versions exécutent le même code et donnent les mêmes résultats pour une
+même graine ; l'implémentation de référence sur la grille de caractères reste
+celle de maze7.
+"""
+from array import array
+
+try:
+    import numba
+    import numpy
+except ImportError:  # Numba est optionnel
+    numba = None
+    numpy = None
+
+ACCELERATED = numba is not None
+
+# Codes des cellules pendant le creusement ; BORDER n'est ni un mur à creuser ni un passage
+WALL, OPEN, START, GOAL, BORDER = 0, 1, 2, 3, 4
+CELL_CHARS = bytes.maketrans(b'\x00\x01\x02\x03', b'#0SG')
+
+
+def carve_prim(cells, stride, walls, nwalls, block, index, carved, order, stop_at):
+    """
+    Prim aléatoire de MazeGenerator._iter_paths : tire un mur de la liste walls
+    (multiplication-décalage sur les mots de block à partir de index, retrait
+    par échange avec le dernier), le creuse s'il touche exactement une cellule
+    ouverte ou le départ, puis ajoute ses voisins murs (droite, bas, gauche,
+    haut, comme Player.moves). S'arrête quand la liste est vide, quand block est
+    épuisé ou quand carved atteint stop_at.
+    Retourne (nwalls, index, carved) ; order reçoit les cellules creusées.
+    """
+    offsets = (1, stride, -1, -stride)
+    while nwalls > 0 and index < len(block) and carved != stop_at:
+        k = (int(block[index]) * nwalls) >> 32
+        index += 1
+        cell = walls[k]
+        nwalls -= 1
+        walls[k] = walls[nwalls]
+        count = 0
+        for offset in offsets:
+            code = cells[cell + offset]
+            if code == OPEN or code == START:
+                count += 1
+        if count != 1:
+            continue
+        cells[cell] = OPEN
+        order[carved] = cell
+        carved += 1
+        for offset in offsets:
+            if cells[cell + offset] == WALL:
+                walls[nwalls] = cell + offset
+                nwalls += 1
+    return nwalls, index, carved
+
+
+def bfs(walls, goals, stride, start, parents, queue):
+    """
+    BFS de Player.bfs sur le masque bordé de Maze.walls : queue reçoit les
+    cellules dans l'ordre de découverte (l'ordre d'exploration), parents la
+    cellule précédente (-1 pour le départ, -2 pour les cellules non atteintes).
+    Retourne (arrivée atteinte ou -1, nombre de cellules découvertes).
+    """
+    offsets = (1, stride, -1, -stride)
+    parents[start] = -1
+    queue[0] = start
+    head = 0
+    tail = 1
+    while head < tail:
+        cell = queue[head]
+        head += 1
+        if goals[cell]:
+            return cell, tail
+        for offset in offsets:
+            neighbour = cell + offset
+            if not walls[neighbour] and parents[neighbour] == -2:
+                parents[neighbour] = cell
+                queue[tail] = neighbour
+                tail += 1
+    return -1, tail
+
+
+def dfs(walls, goals, stride, start, visited, stack, next_move):
+    """
+    DFS récursive de Player.dfs (maze8) avec une pile explicite, sur le masque
+    bordé de Maze.walls. Retourne (arrivée atteinte ou -1, longueur de la pile,
+    nombre d'entrées de l'ordre d'exploration : une par entrée dans une cellule
+    et une par retour arrière). Si l'arrivée est atteinte, la pile contient le chemin.
+    """
+    offsets = (1, stride, -1, -stride)
+    moves = 1
+    if goals[start]:
+        stack[0] = start
+        return start, 1, moves
+    visited[start] = 1
+    stack[0] = start
+    next_move[0] = 0
+    depth = 1
+    while depth > 0:
+        cell = stack[depth - 1]
+        d = next_move[depth - 1]
+        if d == 4:
+            depth -= 1
+            moves += 1
+            continue
+        next_move[depth - 1] = d + 1
+        neighbour = cell + offsets[d]
+        if walls[neighbour] or visited[neighbour]:
+            continue
+        moves += 1
+        stack[depth] = neighbour
+        depth += 1
+        if goals[neighbour]:
+            return neighbour, depth, moves
+        visited[neighbour] = 1
+        next_move[depth - 1] = 0
+    return -1, 0, moves
+
+
+if ACCELERATED:
+    carve_prim = numba.njit(cache=True)(carve_prim)
+    bfs = numba.njit(cache=True)(bfs)
+    dfs = numba.njit(cache=True)(dfs)
+
+
+def _bytes(size, fill=0):
+    # Tampon d'octets modifiable : tableau NumPy pour Numba, bytearray sinon
+    if ACCELERATED:
+        return numpy.full(size, fill, dtype=numpy.uint8)
+    return bytearray([fill]) * size
+
+
+def int_buffer(size, fill=0):
+    """
+    Tableau d'entiers 64 bits modifiable, au format attendu par les noyaux.
+    """
+    if ACCELERATED:
+        return numpy.full(size, fill, dtype=numpy.int64)
+    return array('q', [fill]) * size
+
+
+def words(block):
+    """
+    Bloc de mots d'un BlockRandom (voir BlockRandom.word_block) au format des noyaux.
+    """
+    if ACCELERATED:
+        return numpy.asarray(block, dtype=numpy.uint32)
+    return block
+
+
+_GRID_CODES = bytes(WALL if b == ord('#') else START if b == ord('S') else GOAL if b == ord('G') else OPEN
+                    for b in range(256))
+
+
+def cells_from_grid(grid):
+    """
+    Codes des cellules (WALL, OPEN, START, GOAL) d'une grille de caractères,
+    entourés d'une bordure BORDER.
+    """
+    stride = len(grid[0]) + 2
+    border = bytes([BORDER]) * stride
+    cells = bytearray(border + b"".join(bytes([BORDER]) + "".join(row).encode().translate(_GRID_CODES)
+                                        + bytes([BORDER]) for row in grid) + border)
+    if ACCELERATED:
+        return numpy.frombuffer(cells, dtype=numpy.uint8)
+    return cells
+
+
+def grid_from_cells(cells, width):
+    """
+    Grille de caractères ('#', '0', 'S', 'G') à partir des codes des cellules, sans la bordure.
+    """
+    stride = width + 2
+    chars = bytes(cells).translate(CELL_CHARS).decode()
+    return [list(chars[x + 1:x + stride - 1]) for x in range(stride, len(chars) - stride, stride)]
+
+
+def _search_arrays(maze, start=None, goals=None):
+    # Le masque bordé du Maze sert tel quel ; les arrivées sont marquées au même indice
+    walls = maze.walls
+    if ACCELERATED:
+        walls = numpy.frombuffer(walls, dtype=numpy.uint8)
+    targets = _bytes(len(maze.walls))
+    for goal in (maze.goals if goals is None else goals):
+        targets[maze.index(*goal)] = 1
+    return walls, targets, maze.stride, maze.index(*(maze.start if start is None else start))
+
+
+def solve_bfs(maze, start=None, goals=None):
+    """
+    Résout maze comme Player.bfs, sans affichage. start et goals remplacent
+    maze.start et maze.goals pour une requête entre deux autres cellules.
+    Retourne (chemin ou None, nombre de cellules de l'ordre d'exploration).
+    """
+    walls, goals, stride, start = _search_arrays(maze, start, goals)
+    parents = int_buffer(len(goals), -2)
+    queue = int_buffer(len(goals))
+    goal, count = bfs(walls, goals, stride, start, parents, queue)
+    if goal < 0:
+        return None, int(count)
+    path = []
+    cell = int(goal)
+    while cell >= 0:
+        path.append(maze.position(cell))
+        cell = int(parents[cell])
+    path.reverse()
+    return path, int(count)
+
+
+def solve_dfs(maze):
+    """
+    Résout maze comme Player.dfs (maze8), sans affichage. Retourne (chemin ou
+    None, nombre d'entrées de l'ordre d'exploration).
+    """
+    walls, goals, stride, start = _search_arrays(maze)
+    size = len(goals)
+    stack = int_buffer(size)
+    goal, depth, moves = dfs(walls, goals, stride, start, _bytes(size), stack, _bytes(size))
+    if goal < 0:
+        return None, int(moves)
+    return [maze.position(int(stack[k])) for k in range(depth)], int(moves)
@@ -0,0 +1,104 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+async def request(reader, writer, method, path, payload=None):
+    """
+    Envoie une requête HTTP/1.1 sur une connexion keep-alive et retourne (statut, corps JSON).
+    """
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: maze\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def connect(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def run(args):
+    reader, writer = await connect(args)
+    status, maze = await request(reader, writer, "POST", "/generate",
+                                 {"width": args.width, "height": args.height, "seed": args.seed,
+                                  "algorithm": args.algorithm})
+    writer.close()
+    if status != 200:
+        raise SystemExit(f"Génération refusée ({status}) : {maze.get('error')}")
+    open_cells = [[x, y] for x, row in enumerate(maze["grid"]) for y, c in enumerate(row) if c != '#']
+    rng = random.Random(args.seed)
+    latencies = []
+    errors = 0
+    remaining = args.requests
+
+    async def client():
+        nonlocal remaining, errors
+        reader, writer = await connect(args)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                payload = {"id": maze["id"], "start": rng.choice(open_cells)}
+                if args.random_goals:
+                    payload["goal"] = rng.choice(open_cells)
+                started = time.perf_counter()
+                status, _ = await request(reader, writer, "POST", "/solve", payload)
+                latencies.append(time.perf_counter() - started)
+                errors += status != 200
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    reader, writer = await connect(args)
+    _, stats = await request(reader, writer, "GET", "/stats")
+    writer.close()
+
+    latencies.sort()
+    print(f"{len(latencies)} requêtes en {elapsed:.3f} s ({errors} erreurs), concurrence {args.concurrency}")
+    print(f"débit : {len(latencies) / elapsed:,.0f} requêtes/s")
+    print(f"latence p50 : {1000 * percentile(latencies, 0.50):.2f} ms, "
+          f"p99 : {1000 * percentile(latencies, 0.99):.2f} ms, "
+          f"max : {1000 * latencies[-1]:.2f} ms")
+    print(f"lots côté serveur : {stats['batches']}, taille moyenne {stats['mean_batch']:.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Générateur de charge pour maze_service.py.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", help="chemin du socket Unix du service")
+    parser.add_argument("--width", type=int, default=101)
+    parser.add_argument("--height", type=int, default=101)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--algorithm", default="prim")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--random-goals", action="store_true",
+                        help="arrivée aléatoire par requête (sinon l'arrivée du labyrinthe, partagée)")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from array import array
+from collections import deque
+
+
+def nearest_goal_field(maze, goals=None):
+    """
+    BFS multi-source depuis toutes les arrivées de goals (maze.goals par défaut).
+    Retourne (distances, exits, parents) : tableaux à plat indexés par x * largeur + y,
+    distance à l'arrivée la plus proche (-1 si inaccessible), indice de cette arrivée
+    et indice de la cellule suivante vers elle (-1 pour les arrivées et les murs).
+    """
+    height, width = len(maze.grid), len(maze.grid[0])
+    size = height * width
+    distances = array('i', [-1]) * size
+    exits = array('i', [-1]) * size
+    parents = array('i', [-1]) * size
+    queue = deque()
+    for x, y in (maze.goals if goals is None else goals):
+        i = x * width + y
+        distances[i] = 0
+        exits[i] = i
+        queue.append(i)
+
+    # Décalage de chaque direction dans le masque bordé de maze.walls et dans les tableaux
+    walls, stride = maze.walls, maze.stride
+    steps = [(1, 1), (stride, width), (-1, -1), (-stride, -width)]
+    while queue:
+        i = queue.popleft()
+        x, y = divmod(i, width)
+        p = (x + 1) * stride + y + 1
+        for offset, step in steps:
+            if not walls[p + offset]:
+                j = i + step
+                if distances[j] < 0:
+                    distances[j] = distances[i] + 1
+                    exits[j] = exits[i]
+                    parents[j] = i
+                    queue.append(j)
+    return distances, exits, parents
+
+
+def nearest_exits(maze, starts=None):
+    """
+    Pour chaque départ (maze.start par défaut), retourne (sortie, distance, chemin)
+    vers la sortie la plus proche, ou None si aucune n'est accessible. Une seule
+    BFS multi-source remplace une BFS par agent.
+    """
+    if starts is None:
+        starts = [maze.start]
+    width = len(maze.grid[0])
+    distances, exits, parents = nearest_goal_field(maze)
+    results = {}
+    for start in starts:
+        i = start[0] * width + start[1]
+        if distances[i] < 0:
+            results[start] = None
+            continue
+        path = [start]
+        while parents[i] >= 0:
+            i = parents[i]
+            path.append(divmod(i, width))
+        results[start] = (divmod(exits[i], width), distances[start[0] * width + start[1]], path)
+    return results
@@ -0,0 +1,113 @@
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+
+def add_arguments(parser):
+    """
+    Ajoute les options de profilage communes aux scripts de démonstration.
+    """
+    parser.add_argument("--profile", choices=["cprofile", "sample"],
+                        help="exécute la démonstration sous cProfile ou sous un profileur par échantillonnage")
+    parser.add_argument("--profile-out", default="profile_output",
+                        help="préfixe des fichiers produits (.prof, .collapsed, .top.txt)")
+    parser.add_argument("--top", type=int, default=20,
+                        help="nombre de fonctions dans le résumé")
+    parser.add_argument("--interval", type=float, default=0.001,
+                        help="période d'échantillonnage en secondes (mode sample)")
+
+
+def run(func, args):
+    """
+    Exécute func directement, ou sous le profileur choisi par --profile.
+    """
+    if not args.profile:
+        return func()
+    if args.profile == "cprofile":
+        return profile_cprofile(func, args.profile_out, args.top)
+    return profile_sampling(func, args.profile_out, args.top, args.interval)
+
+
+def _frame_name(code):
+    return f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}"
+
+
+def _write_report(prefix, collapsed, top_lines):
+    with open(f"{prefix}.collapsed", "w") as f:
+        for stack, weight in sorted(collapsed.items()):
+            if weight > 0:
+                f.write(f"{stack} {weight}\n")
+    with open(f"{prefix}.top.txt", "w") as f:
+        f.write("\n".join(top_lines) + "\n")
+    print("\n".join(top_lines), file=sys.stderr)
+    print(f"Profil écrit dans {prefix}.collapsed et {prefix}.top.txt", file=sys.stderr)
+
+
+def profile_cprofile(func, prefix, top):
+    """
+    Profile func avec cProfile. La pile « collapsed » est reconstruite en
+    rattachant chaque fonction à son appelant le plus coûteux (approximation).
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        profiler.dump_stats(f"{prefix}.prof")
+        stats = pstats.Stats(profiler)
+
+        collapsed = Counter()
+        for func_key, (_, _, tottime, _, _) in stats.stats.items():
+            stack = []
+            current = func_key
+            while current is not None and current not in stack:
+                stack.append(current)
+                callers = stats.stats[current][4] if current in stats.stats else {}
+                current = max(callers, key=lambda c: callers[c][3]) if callers else None
+            names = [f"{f.rsplit('/', 1)[-1]}:{name}" for f, _, name in reversed(stack)]
+            collapsed[";".join(names)] += int(tottime * 1_000_000)
+
+        buffer = io.StringIO()
+        pstats.Stats(profiler, stream=buffer).sort_stats("tottime").print_stats(top)
+        _write_report(prefix, collapsed, buffer.getvalue().strip().splitlines())
+
+
+def profile_sampling(func, prefix, top, interval):
+    """
+    Profile func en échantillonnant la pile du thread principal toutes les interval secondes.
+    """
+    target = threading.get_ident()
+    collapsed = Counter()
+    done = threading.Event()
+
+    def sampler():
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                collapsed[";".join(reversed(stack))] += 1
+
+    thread = threading.Thread(target=sampler, daemon=True)
+    started = time.perf_counter()
+    thread.start()
+    try:
+        return func()
+    finally:
+        done.set()
+        thread.join()
+        elapsed = time.perf_counter() - started
+
+        total = sum(collapsed.values())
+        own = Counter()
+        for stack, count in collapsed.items():
+            own[stack.rsplit(";", 1)[-1]] += count
+        top_lines = [f"{total} échantillons en {elapsed:.3f} s"]
+        for name, count in own.most_common(top):
+            top_lines.append(f"{count:8d} {100 * count / max(total, 1):6.2f}%  {name}")
+        _write_report(prefix, collapsed, top_lines)
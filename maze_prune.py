@@ -0,0 +1,58 @@
+from collections import deque
+
+
+def fill_dead_ends(maze):
+    """
+    Remplit itérativement les impasses du labyrinthe (hors départ et arrivées).
+    Retourne un nouveau labyrinthe de la même classe où les cellules remplies
+    sont des murs ; seules restent les cellules des chemins départ-arrivée.
+    Le nombre et la proportion de cellules ouvertes supprimées sont exposés
+    dans les attributs removed et removed_fraction du résultat.
+    """
+    height, width = len(maze.grid), len(maze.grid[0])
+    size = height * width
+    open_cells = bytearray(size)
+    for x in range(height):
+        for y in range(width):
+            if not maze.is_wall(x, y):
+                open_cells[x * width + y] = 1
+
+    # Degré de chaque cellule ouverte : nombre de voisins ouverts
+    degree = bytearray(size)
+    for i in range(size):
+        if open_cells[i]:
+            x, y = divmod(i, width)
+            degree[i] = ((x > 0 and open_cells[i - width]) + (x < height - 1 and open_cells[i + width])
+                         + (y > 0 and open_cells[i - 1]) + (y < width - 1 and open_cells[i + 1]))
+
+    goals = getattr(maze, "goals", [maze.goal])
+    keep = {maze.start[0] * width + maze.start[1]} | {x * width + y for x, y in goals}
+    queue = deque(i for i in range(size) if open_cells[i] and degree[i] <= 1 and i not in keep)
+    removed = 0
+    while queue:
+        i = queue.popleft()
+        if not open_cells[i]:
+            continue
+        open_cells[i] = 0
+        removed += 1
+        x, y = divmod(i, width)
+        for j, inside in ((i - width, x > 0), (i + width, x < height - 1), (i - 1, y > 0), (i + 1, y < width - 1)):
+            if inside and open_cells[j]:
+                degree[j] -= 1
+                if degree[j] <= 1 and j not in keep:
+                    queue.append(j)
+
+    grid = [row[:] for row in maze.grid]
+    for x in range(height):
+        row = grid[x]
+        for y in range(width):
+            if not open_cells[x * width + y] and not maze.is_wall(x, y):
+                row[y] = '#'
+
+    pruned = type(maze)(grid, maze.start, goals if len(goals) > 1 else maze.goal)
+    if getattr(maze, "costs", None) is not None:
+        pruned.costs = maze.costs
+    total_open = removed + sum(open_cells)
+    pruned.removed = removed
+    pruned.removed_fraction = removed / total_open if total_open else 0.0
+    return pruned
@@ -0,0 +1,123 @@
+from array import array
+import random
+import sys
+
+try:
+    import numpy
+except ImportError:  # NumPy est optionnel
+    numpy = None
+
+
+class BlockRandom:
+    """
+    Générateur pseudo-aléatoire à graine explicite qui tire ses nombres par blocs
+    de mots de 32 bits au lieu d'un appel par tirage. Deux instances créées avec la
+    même graine et le même backend produisent exactement la même suite.
+
+    backend="python" (par défaut) s'appuie sur random.Random.randbytes ;
+    backend="numpy" utilise numpy.random.Generator si NumPy est installé.
+    """
+
+    def __init__(self, seed=None, block_size=4096, backend="python"):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed
+        self.block_size = block_size
+        if backend == "numpy":
+            if numpy is None:
+                raise ImportError("Le backend numpy nécessite NumPy")
+            generator = numpy.random.default_rng(seed)
+            self._fill = lambda: generator.integers(0, 1 << 32, size=block_size, dtype=numpy.uint32).tolist()
+            self._bytes = generator.bytes
+        elif backend == "python":
+            source = random.Random(seed)
+
+            def fill():
+                block = array('I', source.randbytes(4 * block_size))
+                if sys.byteorder == "big":
+                    block.byteswap()  # même suite quel que soit le boutisme de la machine
+                return block
+
+            self._fill = fill
+            self._bytes = source.randbytes
+        else:
+            raise ValueError(f"Backend inconnu : {backend}")
+        self.backend = backend
+        self._block = self._fill()
+        self._index = 0
+
+    def _next_word(self):
+        if self._index == len(self._block):
+            self._block = self._fill()
+            self._index = 0
+        word = self._block[self._index]
+        self._index += 1
+        return word
+
+    def word_block(self):
+        """
+        Bloc courant de mots de 32 bits et position du prochain mot non consommé,
+        pour un noyau qui fait ses tirages lui-même (voir maze_kernels). Il
+        signale ensuite la position atteinte par consume().
+        """
+        if self._index == len(self._block):
+            self._block = self._fill()
+            self._index = 0
+        return self._block, self._index
+
+    def consume(self, index):
+        self._index = index
+
+    def randbelow(self, n):
+        """
+        Entier uniforme dans [0, n) par multiplication-décalage (n < 2**32).
+        """
+        return (self._next_word() * n) >> 32
+
+    def randint(self, a, b):
+        return a + self.randbelow(b - a + 1)
+
+    def random(self):
+        return self._next_word() / 4294967296.0
+
+    def choice(self, seq):
+        return seq[self.randbelow(len(seq))]
+
+    def randbytes(self, n):
+        """
+        n octets aléatoires en un seul appel. Ils viennent de la même source que les
+        blocs de mots : la suite obtenue dépend de l'ordre des appels à randbytes et
+        des renouvellements de bloc, et reste reproductible pour une même graine et
+        une même séquence d'appels.
+        """
+        return self._bytes(n)
+
+
+def wall_mask(rng, size, count, keep=()):
+    """
+    Masque (bytearray, 1 = mur) de size cellules contenant exactement count murs,
+    répartis uniformément hors des indices de keep.
+
+    Un octet aléatoire par cellule comparé à un seuil (bytes.translate) donne en une
+    seule opération un tirage de Bernoulli proche de la densité voulue ; l'écart au
+    nombre exact, de l'ordre de la racine de size, est corrigé cellule par cellule.
+    """
+    keep = set(keep)
+    count = min(count, size - len(keep))
+    threshold = round(256 * count / size) if size else 0
+    table = bytes(1 if b < threshold else 0 for b in range(256))
+    mask = bytearray(rng.randbytes(size).translate(table))
+    for i in keep:
+        mask[i] = 0
+    walls = mask.count(1)
+    while walls < count:
+        i = rng.randbelow(size)
+        if not mask[i] and i not in keep:
+            mask[i] = 1
+            walls += 1
+    while walls > count:
+        i = rng.randbelow(size)
+        if mask[i]:
+            mask[i] = 0
+            walls -= 1
+    return mask
@@ -0,0 +1,284 @@
+import argparse
+import contextlib
+import io
+import struct
+import zlib
+
+from maze_algorithms import ALGORITHMS, connect_to_lattice
+from maze_random import BlockRandom
+
+# Drapeaux d'une cellule ; un pixel réduit garde la couche la plus prioritaire de son bloc
+OPEN, VISITED, PATH, START, GOAL = 1, 2, 4, 8, 16
+OVERLAYS = PATH | START | GOAL
+
+# Indices de palette : mur, passage, visité, chemin, départ, arrivée
+PALETTE = [(32, 32, 32), (255, 255, 255), (173, 216, 230), (220, 40, 40), (40, 160, 60), (240, 170, 0)]
+
+# Caractère de la grille -> drapeaux ('#' mur, 'x' visité, tout le reste ouvert)
+_CHAR_FLAGS = bytes(0 if b == ord('#') else VISITED | OPEN if b == ord('x') else OPEN for b in range(256))
+# Masque compact (1 = mur) -> drapeaux
+_MASK_FLAGS = bytes(OPEN if b == 0 else 0 for b in range(256))
+_KEEP_OVERLAYS = bytes(b & OVERLAYS for b in range(256))
+
+
+def _palette_index(flags):
+    for index, bit in ((5, GOAL), (4, START), (3, PATH), (2, VISITED), (1, OPEN)):
+        if flags & bit:
+            return index
+    return 0
+
+
+_FLAGS_TO_PALETTE = bytes(_palette_index(b) for b in range(256))
+
+
+def grid_rows(maze):
+    """
+    Rangées de drapeaux d'un Maze (grille de caractères), une par une.
+    """
+    for row in maze.grid:
+        yield "".join(row).encode().translate(_CHAR_FLAGS)
+
+
+def mask_rows(mask, width):
+    """
+    Rangées de drapeaux d'un masque compact (1 = mur) indexé par x * width + y.
+    """
+    for start in range(0, len(mask), width):
+        yield mask[start:start + width].translate(_MASK_FLAGS)
+
+
+def _overlay_rows(rows, path, start, goals):
+    # Ajoute chemin, départ et arrivées aux rangées, sans matérialiser la grille entière
+    marks = {}
+    for cells, bit in ((path or (), PATH), ([start] if start is not None else (), START), (goals or (), GOAL)):
+        for x, y in cells:
+            marks.setdefault(x, []).append((y, bit))
+    for x, row in enumerate(rows):
+        if x in marks:
+            row = bytearray(row)
+            for y, bit in marks[x]:
+                row[y] |= bit
+        yield row
+
+
+def _or_bytes(a, b):
+    return (int.from_bytes(a, "big") | int.from_bytes(b, "big")).to_bytes(len(a), "big")
+
+
+def _downsampled(rows, width, factor):
+    """
+    Une rangée de sortie par bande de factor rangées : la couche de base (mur,
+    passage, visité) est prise au coin du bloc, les couches chemin, départ et
+    arrivée sont conservées si une cellule du bloc les porte.
+    """
+    padded = -(-width // factor) * factor
+    band = []
+    for row in rows:
+        band.append(bytes(row) + bytes(padded - width))
+        if len(band) == factor:
+            yield _reduce_band(band, factor)
+            band = []
+    if band:
+        yield _reduce_band(band, factor)
+
+
+def _reduce_band(band, factor):
+    overlay = band[0]
+    for row in band[1:]:
+        overlay = _or_bytes(overlay, row)  # OU sur toute la largeur en une opération entière
+    overlay = overlay.translate(_KEEP_OVERLAYS)
+    columns = overlay[0::factor]
+    for k in range(1, factor):
+        columns = _or_bytes(columns, overlay[k::factor])
+    return _or_bytes(band[0][0::factor], columns)
+
+
+def _upscaled(rows, scale):
+    for row in rows:
+        wide = bytearray(len(row) * scale)
+        for k in range(scale):
+            wide[k::scale] = row  # chaque cellule répétée scale fois
+        for _ in range(scale):
+            yield wide
+
+
+class PngWriter:
+    """
+    PNG en couleurs indexées (8 bits par pixel), écrit rangée par rangée : les
+    données compressées partent dans des blocs IDAT dès qu'elles dépassent 64 Ko.
+    """
+
+    def __init__(self, file, width, height, palette=PALETTE):
+        self.file = file
+        self.compressor = zlib.compressobj(1)  # niveau rapide : les aplats se compressent déjà très bien
+        self.buffer = bytearray()
+        file.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0))
+        self._chunk(b"PLTE", bytes(channel for colour in palette for channel in colour))
+
+    def _chunk(self, kind, data):
+        self.file.write(struct.pack(">I", len(data)) + kind + data
+                        + struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+    def write_row(self, indices):
+        self.buffer += self.compressor.compress(b"\x00" + bytes(indices))  # filtre 0 : aucun
+        if len(self.buffer) >= 1 << 16:
+            self._chunk(b"IDAT", bytes(self.buffer))
+            self.buffer.clear()
+
+    def close(self):
+        self.buffer += self.compressor.flush()
+        self._chunk(b"IDAT", bytes(self.buffer))
+        self._chunk(b"IEND", b"")
+
+
+def _pixel_rows(rows, width, path, start, goals, scale, downsample):
+    rows = _overlay_rows(rows, path, start, goals)
+    if downsample > 1:
+        rows = _downsampled(rows, width, downsample)
+    for row in (_upscaled(rows, scale) if scale > 1 else rows):
+        yield bytes(row).translate(_FLAGS_TO_PALETTE)
+
+
+def _output_size(width, height, scale, downsample):
+    return -(-width // downsample) * scale, -(-height // downsample) * scale
+
+
+def render_png(filename, rows, width, height, path=None, start=None, goals=(), scale=1, downsample=1):
+    """
+    Écrit l'image PNG d'un labyrinthe à partir de ses rangées de drapeaux
+    (grid_rows ou mask_rows) : murs, cellules visitées, chemin, départ et arrivées.
+    scale agrandit chaque cellule en un carré de scale pixels ; downsample réduit
+    chaque bloc de downsample x downsample cellules à un pixel. Les rangées sont
+    consommées au fur et à mesure : la mémoire ne dépend que de la largeur.
+    """
+    out_width, out_height = _output_size(width, height, scale, downsample)
+    with open(filename, "wb") as f:
+        writer = PngWriter(f, out_width, out_height)
+        for row in _pixel_rows(rows, width, path, start, goals, scale, downsample):
+            writer.write_row(row)
+        writer.close()
+
+
+def render_tiles(prefix, rows, width, height, tile=2048, path=None, start=None, goals=(), scale=1, downsample=1):
+    """
+    Comme render_png, mais découpe l'image en tuiles de tile x tile pixels
+    écrites dans prefix_<rangée>_<colonne>.png. Une seule bande de tuiles est
+    ouverte à la fois. Retourne la liste des fichiers écrits.
+    """
+    out_width, out_height = _output_size(width, height, scale, downsample)
+    columns = range(0, out_width, tile)
+    names = []
+    band = None
+    for y, row in enumerate(_pixel_rows(rows, width, path, start, goals, scale, downsample)):
+        if y % tile == 0:
+            if band:
+                for f, writer in band:
+                    writer.close()
+                    f.close()
+            r = y // tile
+            band = []
+            for c, left in enumerate(columns):
+                name = f"{prefix}_{r}_{c}.png"
+                f = open(name, "wb")
+                band.append((f, PngWriter(f, min(tile, out_width - left), min(tile, out_height - y))))
+                names.append(name)
+        for (f, writer), left in zip(band, columns):
+            writer.write_row(row[left:left + tile])
+    for f, writer in band or ():
+        writer.close()
+        f.close()
+    return names
+
+
+def render_svg(filename, rows, width, height, path=None, start=None, goals=(), cell=10):
+    """
+    Écrit le labyrinthe en SVG : un rectangle par suite de cellules identiques
+    d'une rangée (murs et cellules visitées), le chemin en polyligne.
+    """
+    colours = ["#%02x%02x%02x" % colour for colour in PALETTE]
+    with open(filename, "w") as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width * cell}" height="{height * cell}" '
+                f'viewBox="0 0 {width} {height}" shape-rendering="crispEdges">\n')
+        f.write(f'<rect width="{width}" height="{height}" fill="{colours[1]}"/>\n')
+        for x, row in enumerate(rows):
+            row = bytes(row).translate(_FLAGS_TO_PALETTE)
+            y = 0
+            while y < width:
+                index = row[y]
+                run = y + 1
+                while run < width and row[run] == index:
+                    run += 1
+                if index in (0, 2):
+                    f.write(f'<rect x="{y}" y="{x}" width="{run - y}" height="1" fill="{colours[index]}"/>\n')
+                y = run
+        if path:
+            points = " ".join(f"{y + 0.5},{x + 0.5}" for x, y in path)
+            f.write(f'<polyline points="{points}" fill="none" stroke="{colours[3]}" stroke-width="0.4"/>\n')
+        for (x, y), index in [(start, 4)] * (start is not None) + [(g, 5) for g in goals]:
+            f.write(f'<rect x="{y}" y="{x}" width="1" height="1" fill="{colours[index]}"/>\n')
+        f.write("</svg>\n")
+
+
+def render_maze(maze, filename, path=None, **options):
+    """
+    Rend un Maze en PNG ou en SVG selon l'extension de filename ; les cellules
+    marquées 'x' par le Player apparaissent comme visitées.
+    """
+    height, width = len(maze.grid), len(maze.grid[0])
+    render = render_svg if filename.endswith(".svg") else render_png
+    render(filename, grid_rows(maze), width, height, path, maze.start, sorted(maze.goals), **options)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génère un labyrinthe et l'exporte en image PNG ou SVG.")
+    parser.add_argument("--width", type=int, default=401)
+    parser.add_argument("--height", type=int, default=401)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--algorithm", choices=["prim"] + sorted(ALGORITHMS), default="backtracker")
+    parser.add_argument("--out", default="maze.png", help="fichier de sortie (.png ou .svg)")
+    parser.add_argument("--scale", type=int, default=1, help="pixels par cellule (PNG) ou par unité (SVG)")
+    parser.add_argument("--downsample", type=int, default=1, help="cellules par pixel, par côté (PNG)")
+    parser.add_argument("--tile", type=int, help="découpe le PNG en tuiles de TILE pixels de côté")
+    parser.add_argument("--solve", action="store_true", help="superpose l'exploration BFS et le plus court chemin")
+    args = parser.parse_args(argv)
+
+    start, goal = (0, 0), (args.height - 1, args.width - 1)
+    path = None
+    if args.algorithm == "prim" or args.solve:
+        # La résolution a besoin de la grille de caractères du Maze
+        from maze7 import Maze, MazeGenerator
+        from maze_stepwise import StepwiseBFS
+        generator = MazeGenerator(args.width, args.height, args.seed, algorithm=args.algorithm)
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.generate_maze()
+        maze = Maze(generator.grid, generator.start, generator.goal)
+        if args.solve:
+            search = StepwiseBFS(maze)
+            result = search.run()
+            path = result.path
+            for i in search.parents:
+                x, y = divmod(i, args.width)
+                if maze.grid[x][y] == '0':
+                    maze.grid[x][y] = 'x'
+        rows = grid_rows(maze)
+    else:
+        # Masque compact directement, sans grille de caractères
+        mask = ALGORITHMS[args.algorithm](args.width, args.height, BlockRandom(args.seed))
+        goal = connect_to_lattice(mask, args.width, goal)
+        rows = mask_rows(mask, args.width)
+
+    if args.out.endswith(".svg"):
+        render_svg(args.out, rows, args.width, args.height, path, start, [goal], cell=args.scale)
+        print(f"Image écrite dans {args.out}")
+    elif args.tile:
+        names = render_tiles(args.out.rsplit(".", 1)[0], rows, args.width, args.height, args.tile,
+                             path, start, [goal], args.scale, args.downsample)
+        print(f"{len(names)} tuiles écrites ({names[0]} ...)")
+    else:
+        render_png(args.out, rows, args.width, args.height, path, start, [goal], args.scale, args.downsample)
+        print(f"Image écrite dans {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import maze_kernels
+from maze7 import Maze, MazeGenerator
+from maze_algorithms import ALGORITHMS
+from maze_flowfield import FlowField, FlowFieldCache
+
+# Labyrinthes compilés (Maze + champs de directions) conservés par chaque processus de calcul
+WORKER_CACHE_SIZE = 32
+# Taille maximale d'un labyrinthe demandé (largeur x hauteur), pour qu'une requête ne bloque pas un processus
+MAX_CELLS = 1_000_000
+# Labyrinthes gardés par le service (les moins récemment utilisés sont oubliés au-delà)
+MAX_MAZES = 256
+_worker_mazes = OrderedDict()
+
+
+def _generate(width, height, seed, algorithm):
+    """
+    Génère un labyrinthe dans un processus de calcul. Retourne ses cellules sous
+    forme d'octets ('#', '0', 'S', 'G') rangée par rangée, plus le départ et l'arrivée.
+    """
+    generator = MazeGenerator(width, height, seed, algorithm=algorithm)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.generate_maze()
+    cells = "".join("".join(row) for row in generator.grid).encode()
+    return cells, generator.start, generator.goal
+
+
+def _compiled(maze_id, maze):
+    """
+    Labyrinthe compilé du cache du processus. maze est (cellules, largeur,
+    départ, arrivée), ou None si le frontal ne l'a pas envoyé : la fonction
+    retourne alors None quand le labyrinthe n'est pas en cache.
+    """
+    entry = _worker_mazes.get(maze_id)
+    if entry is None:
+        if maze is None:
+            return None
+        cells, width, start, goal = maze
+        grid = [list(cells[x:x + width].decode()) for x in range(0, len(cells), width)]
+        entry = FlowFieldCache(Maze(grid, start, goal))
+        _worker_mazes[maze_id] = entry
+        if len(_worker_mazes) > WORKER_CACHE_SIZE:
+            _worker_mazes.popitem(last=False)
+    else:
+        _worker_mazes.move_to_end(maze_id)
+    return entry
+
+
+def _solve_batch(maze_id, queries, maze=None):
+    """
+    Résout un lot de requêtes (départ, arrivée) sur un même labyrinthe. Le champ
+    de directions vers l'arrivée du labyrinthe est mis en cache ; une arrivée
+    partagée par plusieurs requêtes du lot donne une seule BFS inverse, une
+    arrivée isolée une BFS directe interrompue à l'arrivée.
+    maze est envoyé seulement si le processus n'avait pas le labyrinthe (voir _compiled).
+    Retourne une liste de chemins (listes de positions, None si l'arrivée est
+    inaccessible), ou None si le labyrinthe manque au cache et n'a pas été envoyé.
+    """
+    fields = _compiled(maze_id, maze)
+    if fields is None:
+        return None
+    goal = fields.maze.goal
+    shared = Counter(query_goal for _, query_goal in queries)
+    batch_fields = {}
+    results = []
+    for query_start, query_goal in queries:
+        if query_goal != goal and shared[query_goal] == 1:
+            results.append(maze_kernels.solve_bfs(fields.maze, query_start, [query_goal])[0])
+            continue
+        field = batch_fields.get(query_goal)
+        if field is None:
+            field = fields.get() if query_goal == goal else FlowField(fields.maze, [query_goal])
+            batch_fields[query_goal] = field
+        if field.distance(query_start) is None:
+            results.append(None)
+            continue
+        path = [query_start]
+        step = field.next_step(query_start)
+        while step is not None:
+            path.append(step)
+            step = field.next_step(step)
+        results.append(path)
+    return results
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class MazeService:
+    """
+    Frontal asyncio des requêtes "generate" et "solve". Les calculs partent dans
+    un pool de processus ; les requêtes de résolution d'un même labyrinthe qui
+    arrivent pendant batch_window secondes (ou jusqu'à max_batch) partent en un seul lot.
+    Un labyrinthe demandé ne peut dépasser max_cells cellules ; au-delà de
+    max_mazes labyrinthes, les moins récemment utilisés sont oubliés.
+    """
+
+    def __init__(self, processes=None, batch_window=0.002, max_batch=256, max_cells=MAX_CELLS,
+                 max_mazes=MAX_MAZES):
+        self.pool = ProcessPoolExecutor(processes)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_cells = max_cells
+        self.max_mazes = max_mazes
+        self.mazes = OrderedDict()  # identifiant -> (cellules, largeur, hauteur, départ, arrivée), LRU
+        self.generating = {}  # identifiant -> tâche de génération en cours
+        self.pending = {}  # identifiant -> liste de ((départ, arrivée), future)
+        self.counter = 0
+        self.counters = {"generate": 0, "solve": 0, "batches": 0, "generate_cache_hits": 0,
+                         "worker_misses": 0, "evicted": 0}
+
+    async def generate(self, width, height, seed=None, algorithm="prim"):
+        """
+        Génère un labyrinthe et retourne sa description. Avec une graine, le
+        labyrinthe est reproductible : une demande identique réutilise le précédent.
+        """
+        self.counters["generate"] += 1
+        if seed is None:
+            self.counter += 1
+            maze_id = f"maze-{self.counter}"
+        else:
+            maze_id = f"{algorithm}-{width}x{height}-{seed}"
+        if maze_id in self.mazes:
+            self.counters["generate_cache_hits"] += 1
+            self.mazes.move_to_end(maze_id)
+        else:
+            task = self.generating.get(maze_id)
+            if task is None:
+                loop = asyncio.get_running_loop()
+                task = self.generating[maze_id] = asyncio.ensure_future(
+                    loop.run_in_executor(self.pool, _generate, width, height, seed, algorithm))
+            try:
+                cells, start, goal = await task
+            finally:
+                self.generating.pop(maze_id, None)
+            self.mazes[maze_id] = (cells, width, height, start, goal)
+            if len(self.mazes) > self.max_mazes:
+                self.mazes.popitem(last=False)
+                self.counters["evicted"] += 1
+        return self.describe(maze_id)
+
+    def describe(self, maze_id):
+        cells, width, height, start, goal = self.mazes[maze_id]
+        rows = [cells[x:x + width].decode() for x in range(0, len(cells), width)]
+        return {"id": maze_id, "width": width, "height": height,
+                "start": list(start), "goal": list(goal), "grid": rows}
+
+    def _position(self, maze_id, value, default):
+        cells, width, height = self.mazes[maze_id][:3]
+        if value is None:
+            return default
+        try:
+            x, y = (int(v) for v in value)
+        except (TypeError, ValueError):
+            raise RequestError(400, f"Position invalide : {value!r}")
+        if not (0 <= x < height and 0 <= y < width):
+            raise RequestError(400, f"Position hors du labyrinthe : {(x, y)}")
+        if cells[x * width + y] == ord('#'):
+            raise RequestError(400, f"Position sur un mur : {(x, y)}")
+        return (x, y)
+
+    async def solve(self, maze_id, start=None, goal=None):
+        """
+        Plus court chemin de start vers goal (départ et arrivée du labyrinthe par défaut).
+        La requête rejoint le lot en attente pour ce labyrinthe.
+        """
+        if not isinstance(maze_id, str) or maze_id not in self.mazes:
+            raise RequestError(404, f"Labyrinthe inconnu : {maze_id}")
+        self.mazes.move_to_end(maze_id)
+        entry = self.mazes[maze_id]
+        maze_start, maze_goal = entry[3:]
+        query = (self._position(maze_id, start, maze_start), self._position(maze_id, goal, maze_goal))
+        self.counters["solve"] += 1
+        future = asyncio.get_running_loop().create_future()
+        batch = self.pending.get(maze_id)
+        if batch is None:
+            batch = self.pending[maze_id] = []
+            asyncio.get_running_loop().call_later(self.batch_window, self._flush, maze_id, entry, batch)
+        batch.append((query, future))
+        if len(batch) >= self.max_batch:
+            self._flush(maze_id, entry, batch)
+        path = await future
+        return {"id": maze_id, "start": list(query[0]), "goal": list(query[1]),
+                "distance": None if path is None else len(path) - 1,
+                "path": None if path is None else [list(cell) for cell in path]}
+
+    def _flush(self, maze_id, entry, batch):
+        if self.pending.get(maze_id) is not batch:
+            return  # lot déjà parti (taille maximale atteinte avant la fin de la fenêtre)
+        del self.pending[maze_id]
+        self.counters["batches"] += 1
+        asyncio.ensure_future(self._run_batch(maze_id, entry, batch))
+
+    async def _run_batch(self, maze_id, entry, batch):
+        # Le lot part sans les cellules ; elles ne sont envoyées que si le processus ne les a pas en cache
+        cells, width, _, start, goal = entry
+        queries = [query for query, _ in batch]
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.pool, _solve_batch, maze_id, queries)
+            if results is None:
+                self.counters["worker_misses"] += 1
+                results = await loop.run_in_executor(self.pool, _solve_batch, maze_id, queries,
+                                                     (cells, width, start, goal))
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self):
+        counters = dict(self.counters)
+        counters["mazes"] = len(self.mazes)
+        counters["mean_batch"] = counters["solve"] / counters["batches"] if counters["batches"] else 0.0
+        return counters
+
+    async def handle(self, method, path, payload):
+        """
+        Aiguille une requête HTTP vers generate, solve ou stats. Retourne (statut, corps JSON).
+        """
+        if method == "GET" and path == "/stats":
+            return 200, self.stats()
+        if method != "POST" or path not in ("/generate", "/solve"):
+            raise RequestError(404, f"Route inconnue : {method} {path}")
+        if not isinstance(payload, dict):
+            raise RequestError(400, "Corps JSON attendu (objet)")
+        if path == "/generate":
+            try:
+                width, height = int(payload.get("width", 40)), int(payload.get("height", 30))
+                seed = payload.get("seed")
+                seed = None if seed is None else int(seed)
+            except (TypeError, ValueError):
+                raise RequestError(400, "width, height et seed doivent être des entiers")
+            algorithm = payload.get("algorithm", "prim")
+            if algorithm != "prim" and algorithm not in ALGORITHMS:
+                raise RequestError(400, f"Algorithme inconnu : {algorithm}")
+            if width < 2 or height < 2:
+                raise RequestError(400, "Le labyrinthe doit mesurer au moins 2x2")
+            if width * height > self.max_cells:
+                raise RequestError(400, f"Le labyrinthe ne peut dépasser {self.max_cells} cellules")
+            return 200, await self.generate(width, height, seed, algorithm)
+        return 200, await self.solve(payload.get("id"), payload.get("start"), payload.get("goal"))
+
+    async def serve_connection(self, reader, writer):
+        """
+        Connexion HTTP/1.1 minimale avec keep-alive : corps JSON de longueur Content-Length.
+        Toute requête reçoit une réponse : 400 si elle est mal formée (la connexion
+        est alors fermée), 500 si son traitement échoue.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    try:
+                        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                        length = int(headers.get("content-length", 0))
+                        if length < 0:
+                            raise ValueError(length)
+                    except ValueError:
+                        keep_alive = False  # sans longueur fiable, la requête suivante est introuvable
+                        raise RequestError(400, "Requête HTTP mal formée")
+                    body = await reader.readexactly(length)
+                    try:
+                        payload = json.loads(body) if body else {}
+                    except ValueError as error:
+                        raise RequestError(400, f"JSON invalide : {error}")
+                    status, result = await self.handle(method, path, payload)
+                except RequestError as error:
+                    status, result = error.status, {"error": str(error)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception as error:
+                    status, result = 500, {"error": f"Erreur interne : {type(error).__name__}: {error}"}
+                data = json.dumps(result).encode()
+                reason = {200: "OK", 400: "Bad Request", 404: "Not Found",
+                          500: "Internal Server Error"}.get(status, "Error")
+                writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def serve(host="127.0.0.1", port=8080, unix=None, processes=None, batch_window=0.002, max_batch=256,
+                max_cells=MAX_CELLS, max_mazes=MAX_MAZES):
+    service = MazeService(processes, batch_window, max_batch, max_cells, max_mazes)
+    if unix:
+        server = await asyncio.start_unix_server(service.serve_connection, unix)
+        print(f"Service de labyrinthes sur {unix}")
+    else:
+        server = await asyncio.start_server(service.serve_connection, host, port)
+        print(f"Service de labyrinthes sur http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+        if unix:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(unix)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Service HTTP de génération et de résolution de labyrinthes.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", help="chemin d'un socket Unix à la place du port TCP")
+    parser.add_argument("--processes", type=int, help="taille du pool de processus (nombre de CPU par défaut)")
+    parser.add_argument("--batch-window", type=float, default=0.002,
+                        help="durée d'accumulation d'un lot de résolutions, en secondes")
+    parser.add_argument("--max-batch", type=int, default=256, help="taille maximale d'un lot")
+    parser.add_argument("--max-cells", type=int, default=MAX_CELLS,
+                        help="nombre maximal de cellules d'un labyrinthe demandé")
+    parser.add_argument("--max-mazes", type=int, default=MAX_MAZES,
+                        help="nombre de labyrinthes gardés en mémoire (les moins récemment utilisés sont oubliés)")
+    args = parser.parse_args(argv)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, args.unix, args.processes, args.batch_window, args.max_batch,
+                          args.max_cells, args.max_mazes))
+
+
+if __name__ == "__main__":
+    main()
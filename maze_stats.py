@@ -0,0 +1,67 @@
+import time
+
+
+class SearchStats:
+    def __init__(self, callback=None):
+        """
+        Compteurs et chronomètres optionnels pour les boucles de recherche du Player.
+        Le callback reçoit le dictionnaire des mesures à la fin de chaque recherche.
+        """
+        self.callback = callback
+        self.expansions = 0
+        self.neighbour_checks = 0
+        self.revisits = 0
+        self.frontier_peak = 0
+        self.phases = {}
+        self._started = {}
+
+    def start(self, phase):
+        """
+        Démarre le chronomètre d'une phase (search, path, render).
+        """
+        self._started[phase] = time.perf_counter()
+
+    def stop(self, phase):
+        """
+        Arrête le chronomètre d'une phase et cumule la durée mesurée.
+        """
+        elapsed = time.perf_counter() - self._started.pop(phase)
+        self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+
+    def frontier(self, size):
+        """
+        Met à jour la taille maximale de la frontière (file BFS ou pile DFS).
+        """
+        if size > self.frontier_peak:
+            self.frontier_peak = size
+
+    def as_dict(self):
+        return {
+            "expansions": self.expansions,
+            "neighbour_checks": self.neighbour_checks,
+            "revisits": self.revisits,
+            "frontier_peak": self.frontier_peak,
+            "phases": dict(self.phases),
+        }
+
+    def emit(self):
+        """
+        Transmet les mesures au callback s'il y en a un.
+        """
+        if self.callback is not None:
+            self.callback(self.as_dict())
+
+    def to_prometheus(self, prefix="maze_player"):
+        """
+        Exporte les mesures au format texte de Prometheus.
+        """
+        lines = []
+        for name in ("expansions", "neighbour_checks", "revisits"):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {getattr(self, name)}")
+        lines.append(f"# TYPE {prefix}_frontier_peak gauge")
+        lines.append(f"{prefix}_frontier_peak {self.frontier_peak}")
+        lines.append(f"# TYPE {prefix}_phase_seconds gauge")
+        for phase, seconds in sorted(self.phases.items()):
+            lines.append(f'{prefix}_phase_seconds{{phase="{phase}"}} {seconds:.6f}')
+        return "\n".join(lines) + "\n"
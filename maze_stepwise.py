@@ -0,0 +1,349 @@
+import sys
+import time
+import zlib
+from array import array
+from collections import deque, namedtuple
+
+from maze7 import MOVES
+
+# Résultat de run() : statut ("found", "exhausted", ou la limite atteinte : "max_expansions",
+# "deadline", "memory"), chemin complet ou partiel vers la cellule explorée la plus proche
+# de l'arrivée (reached), mesures et limites appliquées
+SearchResult = namedtuple("SearchResult", "status path reached expansions elapsed memory limits")
+
+_INT_SIZE = sys.getsizeof(1 << 20)  # taille d'un entier Python hors cache des petits entiers
+
+# Toutes les cellules deviennent '0' sauf les murs : l'empreinte ignore les marques 'x', 'S', 'G'
+_WALLS_ONLY = bytes(b if b == ord('#') else ord('0') for b in range(256))
+
+
+def _ints(data):
+    values = array('i')
+    values.frombytes(data)
+    return values
+
+
+def maze_fingerprint(maze):
+    """
+    Empreinte des murs du labyrinthe, pour vérifier qu'un point de reprise est
+    rechargé sur le même labyrinthe.
+    """
+    cells = "".join("".join(row) for row in maze.grid).encode().translate(_WALLS_ONLY)
+    return zlib.crc32(cells)
+
+
+class StepwiseSearch:
+    """
+    Recherche exécutée par tranches : step(budget) avance d'au plus budget
+    expansions puis rend la main. L'état complet tient dans checkpoint(), que
+    from_checkpoint() recharge, éventuellement dans un autre processus.
+    La grille du labyrinthe n'est ni marquée ni affichée : plusieurs recherches
+    peuvent partager le même labyrinthe.
+    """
+
+    kind = None
+
+    def __init__(self, maze, stats=None):
+        self.maze = maze
+        self.width = len(maze.grid[0])
+        self.height = len(maze.grid)
+        self.stats = stats  # SearchStats optionnel, None = aucune mesure
+        self.expansions = 0
+        self.moves = 0  # nombre d'entrées qu'aurait exploration_order chez le Player équivalent
+        self.status = "running"  # puis "found" ou "exhausted"
+        self.goal = None
+
+    @property
+    def done(self):
+        return self.status != "running"
+
+    def step(self, budget=1000):
+        """
+        Effectue au plus budget expansions. Retourne le statut courant.
+        """
+        raise NotImplementedError
+
+    def iter_steps(self, budget=1000):
+        """
+        Générateur : une tranche de budget expansions par itération, jusqu'à la fin
+        de la recherche. Chaque valeur produite est le statut après la tranche.
+        """
+        while not self.done:
+            yield self.step(budget)
+
+    def path(self):
+        """
+        Chemin du départ à l'arrivée trouvée, None tant qu'elle n'est pas trouvée.
+        """
+        raise NotImplementedError
+
+    def partial_path(self):
+        """
+        Meilleur chemin connu vers la cellule explorée la plus proche d'une arrivée
+        (distance de Manhattan).
+        """
+        raise NotImplementedError
+
+    def memory_usage(self):
+        """
+        Estimation en octets de la mémoire occupée par l'état de la recherche
+        (conteneurs et entiers qu'ils référencent).
+        """
+        raise NotImplementedError
+
+    def run(self, max_expansions=None, time_limit=None, memory_limit=None, budget=1024):
+        """
+        Avance la recherche jusqu'à son terme ou jusqu'à la première limite atteinte :
+        max_expansions expansions pendant cet appel, time_limit secondes, ou un état
+        estimé à memory_limit octets. Les limites sont vérifiées entre deux tranches
+        de budget expansions, le dépassement est donc d'au plus une tranche.
+        Retourne un SearchResult ; une recherche interrompue peut reprendre par un
+        nouvel appel à run().
+        """
+        started = time.perf_counter()
+        first = self.expansions
+        status = None
+        while not self.done:
+            size = budget if max_expansions is None else min(budget, first + max_expansions - self.expansions)
+            if size <= 0:
+                status = "max_expansions"
+                break
+            self.step(size)
+            if self.done:
+                break
+            if time_limit is not None and time.perf_counter() - started >= time_limit:
+                status = "deadline"
+                break
+            if memory_limit is not None and self.memory_usage() >= memory_limit:
+                status = "memory"
+                break
+        path = self.path() if self.status == "found" else self.partial_path()
+        return SearchResult(status or self.status, path, path[-1] if path else None,
+                            self.expansions - first, time.perf_counter() - started, self.memory_usage(),
+                            {"max_expansions": max_expansions, "time_limit": time_limit,
+                             "memory_limit": memory_limit})
+
+    def _goal_distance(self, i):
+        x, y = divmod(i, self.width)
+        return min(abs(x - gx) + abs(y - gy) for gx, gy in self.maze.goals)
+
+    def checkpoint(self):
+        """
+        État sérialisable (entiers, chaînes et octets seulement) : picklable et
+        transmissible à un autre processus.
+        """
+        return {"kind": self.kind, "width": self.width, "height": self.height,
+                "fingerprint": maze_fingerprint(self.maze), "start": self.maze.start,
+                "expansions": self.expansions, "moves": self.moves, "status": self.status,
+                "goal": self.goal}
+
+    @classmethod
+    def from_checkpoint(cls, maze, state, stats=None):
+        """
+        Recrée la recherche sur maze à partir de checkpoint(). Lève ValueError si
+        le point de reprise vient d'un autre type de recherche ou d'un autre labyrinthe.
+        """
+        if state["kind"] != cls.kind:
+            raise ValueError(f"Point de reprise {state['kind']!r}, recherche {cls.kind!r} attendue")
+        if ((state["height"], state["width"]) != (len(maze.grid), len(maze.grid[0]))
+                or state["fingerprint"] != maze_fingerprint(maze)
+                or tuple(state["start"]) != tuple(maze.start)):
+            raise ValueError("Le point de reprise ne correspond pas à ce labyrinthe")
+        search = cls.__new__(cls)
+        StepwiseSearch.__init__(search, maze, stats)
+        search.expansions = state["expansions"]
+        search.moves = state["moves"]
+        search.status = state["status"]
+        search.goal = None if state["goal"] is None else tuple(state["goal"])
+        search._restore(state)
+        return search
+
+    def _restore(self, state):
+        raise NotImplementedError
+
+    def _neighbours(self, i):
+        # Le masque bordé de Maze.walls dispense des tests de bornes
+        walls, stride, width = self.maze.walls, self.maze.stride, self.width
+        x, y = divmod(i, width)
+        p = (x + 1) * stride + y + 1
+        stats = self.stats
+        for offset, step in ((1, 1), (stride, width), (-1, -1), (-stride, -width)):
+            if stats is not None:
+                stats.neighbour_checks += 1
+            if not walls[p + offset]:
+                yield i + step
+
+
+class StepwiseBFS(StepwiseSearch):
+    """
+    BFS de Player.bfs (même ordre d'exploration) découpée en tranches.
+    """
+
+    kind = "bfs"
+
+    def __init__(self, maze, stats=None):
+        super().__init__(maze, stats)
+        start = maze.start[0] * self.width + maze.start[1]
+        self.queue = deque([start])
+        self.parents = {start: -1}  # sert aussi d'ensemble des cellules visitées
+        self.moves = 1
+
+    def step(self, budget=1000):
+        stats = self.stats
+        queue, parents = self.queue, self.parents
+        while budget > 0 and self.status == "running":
+            if not queue:
+                self.status = "exhausted"
+                break
+            i = queue.popleft()
+            budget -= 1
+            self.expansions += 1
+            if stats is not None:
+                stats.expansions += 1
+            x, y = divmod(i, self.width)
+            if self.maze.is_goal(x, y):
+                self.status = "found"
+                self.goal = (x, y)
+                break
+            for j in self._neighbours(i):
+                if j in parents:
+                    if stats is not None:
+                        stats.revisits += 1
+                    continue
+                parents[j] = i
+                queue.append(j)
+                self.moves += 1
+            if stats is not None:
+                stats.frontier(len(queue))
+        return self.status
+
+    def path(self):
+        if self.goal is None:
+            return None
+        path = []
+        i = self.goal[0] * self.width + self.goal[1]
+        while i >= 0:
+            path.append(divmod(i, self.width))
+            i = self.parents[i]
+        path.reverse()
+        return path
+
+    def partial_path(self):
+        i = min(self.parents, key=self._goal_distance)
+        path = []
+        while i >= 0:
+            path.append(divmod(i, self.width))
+            i = self.parents[i]
+        path.reverse()
+        return path
+
+    def memory_usage(self):
+        # Les valeurs de parents et la file référencent les mêmes entiers que les clés
+        return sys.getsizeof(self.parents) + sys.getsizeof(self.queue) + _INT_SIZE * len(self.parents)
+
+    def checkpoint(self):
+        state = super().checkpoint()
+        state["queue"] = array('i', self.queue).tobytes()
+        state["visited"] = array('i', self.parents).tobytes()
+        state["parents"] = array('i', self.parents.values()).tobytes()
+        return state
+
+    def _restore(self, state):
+        self.queue = deque(_ints(state["queue"]))
+        self.parents = dict(zip(_ints(state["visited"]), _ints(state["parents"])))
+
+
+class StepwiseDFS(StepwiseSearch):
+    """
+    DFS de Player.dfs (maze8, même ordre d'exploration) avec une pile explicite
+    à la place de la récursion, découpée en tranches. Le chemin courant est la
+    pile elle-même.
+    """
+
+    kind = "dfs"
+
+    def __init__(self, maze, stats=None):
+        super().__init__(maze, stats)
+        self.visited = set()
+        self.stack = array('i')  # cellules du chemin courant
+        self.next_move = bytearray()  # prochain indice de MOVES à essayer pour chaque cellule de la pile
+        self._pending = maze.start[0] * self.width + maze.start[1]  # prochaine cellule à entrer
+
+    def step(self, budget=1000):
+        stats = self.stats
+        stack, next_move, visited = self.stack, self.next_move, self.visited
+        walls, stride = self.maze.walls, self.maze.stride
+        while budget > 0 and self.status == "running":
+            if self._pending >= 0:
+                i, self._pending = self._pending, -1
+                budget -= 1
+                self.expansions += 1
+                self.moves += 1
+                if stats is not None:
+                    stats.expansions += 1
+                x, y = divmod(i, self.width)
+                if self.maze.is_goal(x, y):
+                    stack.append(i)
+                    self.status = "found"
+                    self.goal = (x, y)
+                    break
+                visited.add(i)
+                stack.append(i)
+                next_move.append(0)
+                if stats is not None:
+                    stats.frontier(len(stack))
+                continue
+            if not stack:
+                self.status = "exhausted"
+                break
+            i = stack[-1]
+            x, y = divmod(i, self.width)
+            k = next_move[-1]
+            if k == len(MOVES):
+                # Retour arrière : aucune direction restante depuis cette cellule
+                stack.pop()
+                next_move.pop()
+                self.moves += 1
+                continue
+            next_move[-1] = k + 1
+            dx, dy = MOVES[k]
+            j = i + dx * self.width + dy
+            # Masque bordé : une direction hors de la grille tombe sur un mur de la bordure
+            passable = not walls[(x + 1 + dx) * stride + y + 1 + dy]
+            if stats is not None:
+                stats.neighbour_checks += 1
+                if passable and j in visited:
+                    stats.revisits += 1
+            if passable and j not in visited:
+                self._pending = j
+        return self.status
+
+    def path(self):
+        if self.goal is None:
+            return None
+        return [divmod(i, self.width) for i in self.stack]
+
+    def partial_path(self):
+        # Seul le chemin courant est connu : on le coupe à sa cellule la plus proche de l'arrivée
+        if not self.stack:
+            return [self.maze.start]
+        best = min(range(len(self.stack)), key=lambda k: self._goal_distance(self.stack[k]))
+        return [divmod(i, self.width) for i in self.stack[:best + 1]]
+
+    def memory_usage(self):
+        return (sys.getsizeof(self.visited) + sys.getsizeof(self.stack) + sys.getsizeof(self.next_move)
+                + _INT_SIZE * len(self.visited))
+
+    def checkpoint(self):
+        state = super().checkpoint()
+        state["stack"] = self.stack.tobytes()
+        state["next_move"] = bytes(self.next_move)
+        state["visited"] = array('i', self.visited).tobytes()
+        state["pending"] = self._pending
+        return state
+
+    def _restore(self, state):
+        self.stack = _ints(state["stack"])
+        self.next_move = bytearray(state["next_move"])
+        self.visited = set(_ints(state["visited"]))
+        self._pending = state["pending"]
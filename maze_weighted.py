@@ -0,0 +1,99 @@
+from maze7 import Player
+
+
+class DialPlayer(Player):
+    """
+    Dijkstra sur les coûts entiers de Maze.costs avec une file à seaux
+    (algorithme de Dial) : insertion et extraction en O(1).
+    """
+
+    def __init__(self, maze, stats=None):
+        super().__init__(maze, stats)
+        self.distances = {}
+        self.cost = None
+
+    def _max_cost(self):
+        if self.maze.costs is None:
+            return 1
+        return max(max(row) for row in self.maze.costs)
+
+    def dijkstra(self):
+        stats = self.stats
+        if stats is not None:
+            stats.start("search")
+        start = self.maze.start
+        walls, stride = self.maze.walls, self.maze.stride
+        neighbours = [(dx, dy, dx * stride + dy) for dx, dy in self.moves]  # décalages dans le masque bordé
+        # Les distances en attente couvrent au plus max_cost + 1 valeurs consécutives
+        bucket_count = self._max_cost() + 1
+        buckets = [[] for _ in range(bucket_count)]
+        buckets[0].append(start)
+        pending = 1
+        distance = 0
+        self.distances[start] = 0
+        self.parents[start] = None
+
+        while pending:
+            bucket = buckets[distance % bucket_count]
+            if not bucket:
+                distance += 1
+                continue
+            x, y = bucket.pop()
+            pending -= 1
+            if self.distances[(x, y)] < distance or (x, y) in self.visited:
+                continue
+            self.visited.add((x, y))
+            if stats is not None:
+                stats.expansions += 1
+            self.order += 1
+            self.exploration_order.append((self.order, (x, y)))
+            if self.maze.is_goal(x, y):
+                if stats is not None:
+                    stats.stop("search")
+                self.cost = distance
+                print(f"Arrivée trouvée à {(x, y)}")
+                self.display_exploration_order()
+                self.total_length_exploration()
+                self.compute_shortest_path((x, y))
+                print(f"Coût total: {distance}")
+                if stats is not None:
+                    stats.emit()
+                return True
+            if (x, y) != start:
+                self.maze.grid[x][y] = 'x'
+                if stats is None:
+                    self.maze.display((x, y))
+                else:
+                    stats.start("render")
+                    self.maze.display((x, y))
+                    stats.stop("render")
+
+            i = (x + 1) * stride + y + 1
+            for dx, dy, offset in neighbours:
+                nx, ny = x + dx, y + dy
+                if stats is not None:
+                    stats.neighbour_checks += 1
+                    if (nx, ny) in self.visited:
+                        stats.revisits += 1
+                if not walls[i + offset] and (nx, ny) not in self.visited:
+                    new_distance = distance + self.maze.cost(nx, ny)
+                    if new_distance < self.distances.get((nx, ny), new_distance + 1):
+                        self.distances[(nx, ny)] = new_distance
+                        self.parents[(nx, ny)] = (x, y)
+                        buckets[new_distance % bucket_count].append((nx, ny))
+                        pending += 1
+                        if stats is not None:
+                            stats.frontier(pending)
+
+        if stats is not None:
+            stats.stop("search")
+        print("Pas de chemin vers la sortie.")
+        self.display_exploration_order()
+        self.total_length_exploration()
+        if stats is not None:
+            stats.emit()
+        return False
+
+    def find_exit(self):
+        if not self.dijkstra():
+            print("Pas de chemin vers la sortie.")